@@ -6,3 +6,6 @@ GOLD_PATH = f"{PREFIX_PATH}/gold"
 BRONZE_LAYER = "bronze_ingestion"
 SILVER_LAYER = "silver_transformation"
 GOLD_LAYER = "gold_analysis"
+
+# Rows per Parquet row group for Silver files
+SILVER_ROW_GROUP_SIZE = 512_000
@@ -47,7 +47,7 @@ class APIClient:
 
         for attempt in range(self.max_retries + 1):
             try:
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
 
                 with httpx.Client(timeout=self.timeout) as client:
                     response = client.get(url, params=params)
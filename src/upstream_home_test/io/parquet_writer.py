@@ -1,11 +1,12 @@
 """Parquet writer for Bronze layer with partitioning and compression."""
 
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal, Optional
 
 import polars as pl
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from upstream_home_test.utils.logging_config import log_pipeline_step
 from upstream_home_test.utils.timing import elapsed_ms_since
@@ -15,6 +16,11 @@ class ParquetWriteError(Exception):
     """Custom exception for Parquet writing errors."""
 
 
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter[list[BaseModel]]:
+    """Return a cached list validator for a Pydantic model class."""
+    return TypeAdapter(list[model])
+
 
 class GenericParquetWriter:
     """Generic Parquet writer with partitioning and compression support."""
@@ -28,6 +34,9 @@ class GenericParquetWriter:
         partition_columns: Optional[list[str]] = None,
         logger: Optional[Any] = None,
         validator_model: Optional[type[BaseModel]] = None,
+        row_group_size: Optional[int] = None,
+        compression_level: Optional[int] = None,
+        data_page_size: Optional[int] = None,
     ):
         """Initialize the Generic Parquet writer.
 
@@ -39,6 +48,12 @@ class GenericParquetWriter:
             partition_columns: Custom partition columns (overrides date/hour partitioning)
             logger: Logger instance for structured logging
             validator_model: Optional Pydantic model used to validate list[dict] inputs
+            row_group_size: Rows per Parquet row group for streamed writes
+                (None keeps the Polars default)
+            compression_level: Compression level for streamed writes
+                (None keeps the codec default)
+            data_page_size: Target data page size in bytes for streamed writes
+                (None keeps the Polars default)
         """
         self.output_dir = output_dir
         self.max_file_size_mb = max_file_size_mb
@@ -47,6 +62,9 @@ class GenericParquetWriter:
         self.partition_columns = partition_columns or ["date", "hour"]
         self.logger = logger
         self.validator_model = validator_model
+        self.row_group_size = row_group_size
+        self.compression_level = compression_level
+        self.data_page_size = data_page_size
 
         # Statistics tracking
         self.files_written = 0
@@ -70,6 +88,13 @@ class GenericParquetWriter:
                 "validator_model must be provided when writing list[dict] inputs"
             )
 
+        # Validate the whole batch in one pydantic-core call; only fall back
+        # to per-message validation to report which messages failed
+        try:
+            return _list_adapter(self.validator_model).validate_python(messages)
+        except ValidationError:
+            pass
+
         validated_messages = []
         validation_errors = []
 
@@ -160,12 +185,13 @@ class GenericParquetWriter:
         # Group by partition columns
         partitions = df.group_by(self.partition_columns, maintain_order=True)
 
-        # Write each partition
+        # Write each partition, counting them as we go
+        unique_partitions = 0
         for group_key, partition_df in partitions:
             self._write_partition(group_key, partition_df)
+            unique_partitions += 1
 
-        # Count unique partitions
-        return df.select(self.partition_columns).unique().height
+        return unique_partitions
 
     def _write_unpartitioned_data(self, df: pl.DataFrame) -> int:
         """Write data without partitioning.
@@ -179,7 +205,7 @@ class GenericParquetWriter:
         self._write_single_file(df)
         return 1
 
-    def _log_write_success(self, unique_partitions: int, start_time: float) -> None:
+    def _log_write_success(self, unique_partitions: int, start_time: int) -> None:
         """Log successful write operation.
 
         Args:
@@ -203,7 +229,7 @@ class GenericParquetWriter:
         )
 
     def _log_write_error(
-        self, error: Exception, df: pl.DataFrame, start_time: float
+        self, error: Exception, df: pl.DataFrame, start_time: int
     ) -> None:
         """Log write operation error.
 
@@ -239,7 +265,7 @@ class GenericParquetWriter:
         Raises:
             ParquetWriteError: If writing fails
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
             # Prepare DataFrame
@@ -278,6 +304,106 @@ class GenericParquetWriter:
             self._log_write_error(e, df, start_time)
             raise ParquetWriteError(f"Failed to write Parquet files: {e!s}") from e
 
+    def sink(
+        self, lf: pl.LazyFrame, sort_by: Optional[list[str]] = None
+    ) -> dict[str, Any]:
+        """Stream a LazyFrame to Parquet without collecting it first.
+
+        Uses the same ``date=YYYY-MM-DD/hour=HH/data.parquet`` layout as
+        ``write``, but writes one file per partition (no size-based splitting)
+        and lets the streaming engine overlap scanning, transforming and
+        encoding. Column statistics are always written, so readers can prune
+        row groups using their min/max values.
+
+        Args:
+            lf: Polars LazyFrame to write
+            sort_by: Optional columns to sort each file by, which clusters
+                values and makes the row group statistics selective
+
+        Returns:
+            Dictionary with write statistics
+
+        Raises:
+            ParquetWriteError: If writing fails
+        """
+        start_time = time.perf_counter_ns()
+
+        self.files_written = 0
+        self.total_rows = 0
+        self.partitions_created = 0
+
+        def _collect_stats(files: pl.DataFrame) -> None:
+            self.files_written = files.height
+            self.total_rows = int(files["num_rows"].sum())
+
+        try:
+            partitioned = (
+                self.partitioning_enabled and "timestamp" in lf.collect_schema()
+            )
+            if partitioned:
+                lf = lf.with_columns(
+                    [
+                        pl.col("timestamp").dt.date().alias("date"),
+                        pl.col("timestamp").dt.hour().alias("hour"),
+                    ]
+                )
+                target = pl.PartitionByKey(
+                    self.output_dir,
+                    file_path=lambda ctx: (
+                        f"{self._partition_subdir([k.raw_value for k in ctx.keys])}"
+                        "/data.parquet"
+                    ),
+                    by=self.partition_columns,
+                    include_key=False,
+                    per_partition_sort_by=sort_by,
+                    finish_callback=_collect_stats,
+                )
+            else:
+                Path(self.output_dir).mkdir(parents=True, exist_ok=True)
+                target = Path(self.output_dir) / "data.parquet"
+                if sort_by:
+                    lf = lf.sort(sort_by)
+
+            lf.sink_parquet(
+                target,
+                compression=self.compression,
+                compression_level=self.compression_level,
+                statistics=True,
+                row_group_size=self.row_group_size,
+                data_page_size=self.data_page_size,
+                mkdir=True,
+                engine="streaming",
+            )
+
+            if partitioned:
+                unique_partitions = self.files_written
+            else:
+                self.files_written = 1
+                self.total_rows = (
+                    pl.scan_parquet(target).select(pl.len()).collect().item()
+                )
+                unique_partitions = 1
+
+            self._log_write_success(unique_partitions, start_time)
+
+            return {
+                "rows": self.total_rows,
+                "files_written": self.files_written,
+                "partitions": unique_partitions,
+                "duration_ms": round(elapsed_ms_since(start_time), 2),
+            }
+
+        except Exception as e:
+            duration_ms = elapsed_ms_since(start_time)
+            log_pipeline_step(
+                logger=self.logger,
+                step="parquet_write",
+                event=f"Failed to write Parquet files: {e!s}",
+                metrics={"error": str(e), "duration_ms": round(duration_ms, 2)},
+                level="ERROR",
+            )
+            raise ParquetWriteError(f"Failed to write Parquet files: {e!s}") from e
+
     def _write_single_file(self, df: pl.DataFrame) -> None:
         """Write DataFrame as a single parquet file.
 
@@ -334,14 +460,15 @@ class GenericParquetWriter:
                     },
                 )
 
-    def _write_partition(self, group_key: tuple, partition_df: pl.DataFrame) -> None:
-        """Write a single partition to parquet files.
+    def _partition_subdir(self, group_key: tuple) -> str:
+        """Build the relative partition directory for a group key.
 
         Args:
             group_key: Tuple of partition values (e.g., date, hour)
-            partition_df: Polars DataFrame containing the partition data
+
+        Returns:
+            Relative path such as ``date=2025-01-27/hour=09``
         """
-        # Create partition path based on partition columns
         partition_parts = []
         for i, col in enumerate(self.partition_columns):
             value = group_key[i]
@@ -349,8 +476,17 @@ class GenericParquetWriter:
                 partition_parts.append(f"{col}={value.strftime('%Y-%m-%d')}")
             else:
                 partition_parts.append(f"{col}={str(value).zfill(2)}")
+        return "/".join(partition_parts)
+
+    def _write_partition(self, group_key: tuple, partition_df: pl.DataFrame) -> None:
+        """Write a single partition to parquet files.
 
-        partition_path = Path(self.output_dir) / "/".join(partition_parts)
+        Args:
+            group_key: Tuple of partition values (e.g., date, hour)
+            partition_df: Polars DataFrame containing the partition data
+        """
+        # Create partition path based on partition columns
+        partition_path = Path(self.output_dir) / self._partition_subdir(group_key)
         partition_path.mkdir(parents=True, exist_ok=True)
 
         # Remove the partitioning columns before writing
@@ -198,7 +198,7 @@ def run_bronze_ingestion(
     # Resolve output directory
     output_dir = _resolve_output_directory(output_dir)
 
-    pipeline_start = time.time()
+    pipeline_start = time.perf_counter_ns()
 
     try:
         # Step 1: Fetch messages from API
@@ -7,6 +7,7 @@ import argparse
 from upstream_home_test.constant import GOLD_PATH, SILVER_PATH
 from upstream_home_test.io.parquet_writer import GenericParquetWriter
 from upstream_home_test.pipelines.reports.sql_report_runner import SQLReportRunner
+from upstream_home_test.utils.logging_config import get_project_root
 
 
 def _resolve_silver_directory(silver_dir: str = None) -> str:
@@ -19,8 +20,6 @@ def _resolve_silver_directory(silver_dir: str = None) -> str:
         Absolute path to silver directory
     """
     if silver_dir is None:
-        from upstream_home_test.utils.logging_config import get_project_root
-
         project_root = get_project_root()
         return str(project_root / SILVER_PATH)
 
@@ -38,7 +37,10 @@ def _get_report_names_to_run(report_names: list[str] = None) -> list[str]:
     """
     if report_names is None:
         runner = SQLReportRunner()
-        return runner.list_available_reports()
+        try:
+            return runner.list_available_reports()
+        finally:
+            runner.close()
 
     return report_names
 
@@ -57,7 +59,10 @@ def _run_sql_reports(
         Dictionary with report results and statistics
     """
     runner = SQLReportRunner()
-    return runner.run_multiple_reports(report_names, silver_dir, **kwargs)
+    try:
+        return runner.run_multiple_reports(report_names, silver_dir, **kwargs)
+    finally:
+        runner.close()
 
 
 def _perform_gold_side_effects(result: dict[str, Any]) -> None:
@@ -112,8 +117,6 @@ def cleanup_old_parquet_files(gold_dir: str | None = None) -> None:
         gold_dir: Directory containing parquet files to clean up
     """
     if gold_dir is None:
-        from upstream_home_test.utils.logging_config import get_project_root
-
         project_root = get_project_root()
         gold_dir = str(project_root / GOLD_PATH)
 
@@ -137,8 +140,6 @@ def write_reports_to_parquet(result: dict[str, Any], gold_dir: str | None = None
         gold_dir: Directory to write parquet files to
     """
     if gold_dir is None:
-        from upstream_home_test.utils.logging_config import get_project_root
-
         project_root = get_project_root()
         gold_dir = str(project_root / GOLD_PATH)
 
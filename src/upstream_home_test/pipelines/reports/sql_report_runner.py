@@ -1,7 +1,11 @@
 """Generic SQL report runner using DuckDB for Gold layer reports."""
 
+import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import TracebackType
 from typing import Any
 
 import duckdb
@@ -10,6 +14,71 @@ from upstream_home_test.constant import GOLD_LAYER
 from upstream_home_test.utils.logging_config import log_pipeline_step, setup_logging
 from upstream_home_test.utils.timing import elapsed_ms_since
 
+SILVER_SCHEMA_FILE = Path(__file__).parent / "silver_schema.json"
+
+
+def load_silver_schema(schema_file: Path = SILVER_SCHEMA_FILE) -> dict[str, str]:
+    """Load the declared Silver layer schema.
+
+    The report view casts every column to these types, so reports see the
+    same types whichever Silver files are present.
+
+    Args:
+        schema_file: JSON file mapping column names to SQL type names
+
+    Returns:
+        Mapping of Silver column names to DuckDB type names
+    """
+    with open(schema_file) as f:
+        return json.load(f)
+
+
+class _StepTimer:
+    """Accumulate one report's metrics and emit them as a single log record."""
+
+    def __init__(self, logger: Any, report_name: str):
+        """Initialize the timer.
+
+        Args:
+            logger: Logger instance for structured logging
+            report_name: Name of the report being timed
+        """
+        self.logger = logger
+        self.report_name = report_name
+        self.metrics: dict[str, Any] = {"report_name": report_name}
+
+    def __enter__(self) -> "_StepTimer":
+        """Start timing the report."""
+        self.start_time = time.perf_counter_ns()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> bool:
+        """Log the report's outcome and metrics without suppressing errors."""
+        self.metrics["duration_ms"] = round(elapsed_ms_since(self.start_time), 2)
+        if exc is None:
+            self.metrics["status"] = "success"
+            event = f"Completed SQL report: {self.report_name}"
+            level = "INFO"
+        else:
+            self.metrics["status"] = "failed"
+            self.metrics["error"] = str(exc)
+            event = f"Failed to run SQL report '{self.report_name}': {exc!s}"
+            level = "ERROR"
+
+        log_pipeline_step(
+            logger=self.logger,
+            step=GOLD_LAYER,
+            event=event,
+            metrics=self.metrics,
+            level=level,
+        )
+        return False
+
 
 class SQLReportRunner:
     """Generic report runner that executes SQL files using DuckDB."""
@@ -24,16 +93,54 @@ class SQLReportRunner:
         self.queries_dir = (
             Path(queries_dir) if queries_dir else Path(__file__).parent / "queries"
         )
-        self.available_reports = self._discover_sql_reports()
-
-    def _discover_sql_reports(self) -> list[str]:
-        """Discover available SQL report files.
+        # Query files do not change during the runner's lifetime
+        self._sql_cache = self._discover_sql_reports()
+        self.available_reports = list(self._sql_cache)
+        self._available_set = set(self.available_reports)
+        self.silver_schema = load_silver_schema()
+        self._silver_files: dict[str, list[str]] = {}
+        # (silver_dir, input_rows) of the current 'report_table' view, if any
+        self._report_view: tuple[str, int] | None = None
+        self._silver_casts = ", ".join(
+            f'CAST("{name}" AS {sql_type}) AS "{name}"'
+            for name, sql_type in self.silver_schema.items()
+        )
+        # Created on first use, so listing reports never opens DuckDB
+        self._conn: duckdb.DuckDBPyConnection | None = None
+
+    @property
+    def conn(self) -> duckdb.DuckDBPyConnection:
+        """Shared DuckDB connection, created on first access."""
+        if self._conn is None:
+            # One long-lived connection for all reports, using every available core
+            self._conn = duckdb.connect(config={"threads": os.cpu_count() or 1})
+            # Keep parquet footers cached across the metadata reads of all reports
+            self._conn.execute("PRAGMA enable_object_cache")
+        return self._conn
+
+    def close(self) -> None:
+        """Close the shared DuckDB connection if it was opened."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._report_view = None
+
+    def __del__(self) -> None:
+        """Close the DuckDB connection when the runner is garbage collected."""
+        if getattr(self, "_conn", None) is not None:
+            self.close()
+
+    def _discover_sql_reports(self) -> dict[str, tuple[str, str]]:
+        """Discover available SQL report files and read their contents.
 
         Returns:
-            List of report names (SQL file names without .sql extension)
+            Mapping of report name (SQL file name without .sql extension) to
+            a tuple of (sql_file_path, sql_query_string)
         """
-        sql_files = list(self.queries_dir.glob("*.sql"))
-        return [f.stem for f in sql_files]
+        return {
+            f.stem: (str(f), f.read_text().strip())
+            for f in self.queries_dir.glob("*.sql")
+        }
 
     def list_available_reports(self) -> list[str]:
         """List all available SQL report files.
@@ -44,7 +151,7 @@ class SQLReportRunner:
         return self.available_reports.copy()
 
     def _load_sql_query(self, report_name: str) -> tuple[str, str]:
-        """Load SQL query from file.
+        """Load SQL query from the cache filled at discovery.
 
         Args:
             report_name: Name of the report
@@ -55,39 +162,87 @@ class SQLReportRunner:
         Raises:
             FileNotFoundError: If SQL file not found
         """
-        sql_file = self.queries_dir / f"{report_name}.sql"
-        if not sql_file.exists():
-            raise FileNotFoundError(f"SQL file not found: {sql_file}")
+        try:
+            return self._sql_cache[report_name]
+        except KeyError:
+            sql_file = self.queries_dir / f"{report_name}.sql"
+            raise FileNotFoundError(f"SQL file not found: {sql_file}") from None
+
+    def _list_silver_files(self, silver_dir: str) -> list[str]:
+        """List the Silver parquet files, once per directory.
+
+        The listing is cached so repeated reports do not walk the directory
+        again; call ``refresh()`` to pick up newly written files.
+
+        Args:
+            silver_dir: Directory containing Silver parquet files
 
-        with open(sql_file) as f:
-            sql_query = f.read().strip()
+        Returns:
+            Sorted list of Silver parquet file paths
+        """
+        files = self._silver_files.get(silver_dir)
+        if files is None:
+            files = sorted(str(path) for path in Path(silver_dir).rglob("*.parquet"))
+            self._silver_files[silver_dir] = files
+        return files
 
-        return str(sql_file), sql_query
+    def refresh(self) -> None:
+        """Forget cached Silver file listings so the next run lists them again."""
+        self._silver_files.clear()
+        self._report_view = None
 
-    def _load_silver_data(self, silver_dir: str, report_name: str) -> pl.DataFrame:
-        """Load Silver layer data.
+    def _count_silver_rows(self, silver_files: list[str]) -> int:
+        """Count Silver rows from the Parquet footers without reading any data.
+
+        Args:
+            silver_files: Silver parquet file paths
+
+        Returns:
+            Total number of rows across all Silver parquet files (0 if none)
+        """
+        if not silver_files:
+            return 0
+        row_count = self.conn.execute(
+            "SELECT COALESCE(SUM(num_rows), 0) FROM parquet_file_metadata(?)",
+            [silver_files],
+        ).fetchone()
+        return int(row_count[0]) if row_count else 0
+
+    def _create_report_view(self, silver_dir: str) -> int:
+        """Expose the Silver Parquet files to DuckDB as the 'report_table' view.
+
+        DuckDB scans the files directly when a report runs, so filters and
+        projections are pushed into the Parquet reader instead of first
+        materializing the whole Silver dataset. The date/hour partition
+        columns are typed so filters on them prune whole partitions. Files
+        are unified by column name, so an all-null (Null-typed) column in one
+        file does not clash with the typed column in another.
+
+        The view is created once per Silver directory and reused by later
+        reports on the same directory.
 
         Args:
             silver_dir: Directory containing Silver parquet files
-            report_name: Name of the report for logging
 
         Returns:
-            Polars DataFrame with Silver data
+            Number of Silver rows behind the view
 
         Raises:
             FileNotFoundError: If no Silver data found
         """
+        if self._report_view is not None and self._report_view[0] == silver_dir:
+            return self._report_view[1]
+
         log_pipeline_step(
             logger=self.logger,
             step="sql_report_runner",
-            event=f"Reading Silver data for {report_name} report",
+            event="Reading Silver data for reports",
             metrics={"silver_dir": silver_dir},
         )
 
-        # Scan all Silver Parquet files
-        df = pl.scan_parquet(silver_dir).collect()
-
-        if df.is_empty():
+        silver_files = self._list_silver_files(silver_dir)
+        input_rows = self._count_silver_rows(silver_files)
+        if input_rows == 0:
             error_msg = f"No Silver data found in {silver_dir}"
             log_pipeline_step(
                 logger=self.logger,
@@ -98,45 +253,45 @@ class SQLReportRunner:
             )
             raise FileNotFoundError(error_msg)
 
-        return df
+        file_list = ", ".join(
+            "'" + path.replace("'", "''") + "'" for path in silver_files
+        )
+        self.conn.execute(
+            f"""
+            CREATE OR REPLACE VIEW report_table AS
+            SELECT * REPLACE ({self._silver_casts})
+            FROM read_parquet(
+                [{file_list}],
+                hive_partitioning = true,
+                union_by_name = true,
+                hive_types = {{'date': DATE, 'hour': INTEGER}}
+            )
+            """
+        )
+        self._report_view = (silver_dir, input_rows)
+        return input_rows
 
-    def _execute_report_query(
-        self, df: pl.DataFrame, sql_query: str, report_name: str, sql_file: str
-    ) -> pl.DataFrame:
-        """Execute SQL query on the DataFrame.
+    def _execute_report_query(self, sql_query: str) -> pl.DataFrame:
+        """Execute SQL query against the 'report_table' view.
 
         Args:
-            df: Input DataFrame
             sql_query: SQL query to execute
-            report_name: Name of the report
-            sql_file: Path to SQL file for logging
 
         Returns:
             Result DataFrame
         """
-        log_pipeline_step(
-            logger=self.logger,
-            step=GOLD_LAYER,
-            event=f"Executing SQL query for {report_name} report",
-            metrics={"sql_file": sql_file, "input_rows": len(df)},
-        )
+        result = self._execute_sql_with_duckdb(sql_query)
 
-        result = self._execute_sql_with_duckdb(df, sql_query)
-
-        # Convert timestamp columns back to proper datetime if they exist
-        for col in result.columns:
-            if "timestamp" in col.lower() and result[col].dtype == pl.Utf8:
-                result = result.with_columns(
-                    pl.col(col).str.to_datetime().dt.replace_time_zone("UTC")
-                )
-
-        # Log completion
-        log_pipeline_step(
-            logger=self.logger,
-            step=GOLD_LAYER,
-            event=f"Completed {report_name} report execution",
-            metrics={"output_rows": len(result), "sql_file": sql_file},
-        )
+        # Convert timestamp columns returned as strings back to proper datetimes
+        ts_cols = [
+            col
+            for col, dtype in result.schema.items()
+            if "timestamp" in col.lower() and dtype == pl.Utf8
+        ]
+        if ts_cols:
+            result = result.with_columns(
+                pl.col(ts_cols).str.to_datetime().dt.replace_time_zone("UTC")
+            )
 
         return result
 
@@ -157,20 +312,35 @@ class SQLReportRunner:
             ValueError: If report name is not found
             FileNotFoundError: If SQL file or Silver data not found
         """
-        # Load SQL query from file
-        sql_file, sql_query = self._load_sql_query(report_name)
+        input_rows = self._create_report_view(silver_dir)
+        return self._run_report_on_table(report_name, input_rows)
 
-        # Load Silver data
-        df = self._load_silver_data(silver_dir, report_name)
+    def _run_report_on_table(self, report_name: str, input_rows: int) -> dict[str, Any]:
+        """Run a single SQL report against the already created 'report_table' view.
 
-        # Execute SQL query
-        result = self._execute_report_query(df, sql_query, report_name, sql_file)
+        Args:
+            report_name: Name of the SQL report to run (without .sql extension)
+            input_rows: Number of rows behind 'report_table'
+
+        Returns:
+            Dictionary with report results
+        """
+        with _StepTimer(self.logger, report_name) as step:
+            step.metrics["input_rows"] = input_rows
+
+            # Load SQL query from cache
+            sql_file, sql_query = self._load_sql_query(report_name)
+            step.metrics["sql_file"] = sql_file
+
+            # Execute SQL query
+            result = self._execute_report_query(sql_query)
+            step.metrics["output_rows"] = len(result)
 
         return {
             "status": "completed",
             "report_name": report_name,
             "sql_file": sql_file,
-            "input_rows": len(df),
+            "input_rows": input_rows,
             "output_rows": len(result),
             "result_data": result,
         }
@@ -190,10 +360,11 @@ class SQLReportRunner:
 
         Raises:
             ValueError: If any report name is not found
+            FileNotFoundError: If no Silver data found
         """
         # Validate all report names
         invalid_reports = [
-            name for name in report_names if name not in self.available_reports
+            name for name in report_names if name not in self._available_set
         ]
         if invalid_reports:
             available = ", ".join(self.available_reports)
@@ -201,7 +372,7 @@ class SQLReportRunner:
                 f"Unknown reports: {invalid_reports}. Available reports: {available}"
             )
 
-        runner_start = time.time()
+        runner_start = time.perf_counter_ns()
 
         log_pipeline_step(
             logger=self.logger,
@@ -214,36 +385,26 @@ class SQLReportRunner:
         successful_reports = []
         failed_reports = []
 
-        for report_name in report_names:
-            try:
-                log_pipeline_step(
-                    logger=self.logger,
-                    step=GOLD_LAYER,
-                    event=f"Starting SQL report: {report_name}",
-                    metrics={"report_name": report_name},
-                )
-
-                result = self.run_sql_report(report_name, silver_dir, **kwargs)
-                results[report_name] = result
-                successful_reports.append(report_name)
+        # Create (or reuse) the Silver view and share it across all reports
+        input_rows = self._create_report_view(silver_dir)
 
-                log_pipeline_step(
-                    logger=self.logger,
-                    step="sql_report_runner",
-                    event=f"Completed SQL report: {report_name}",
-                    metrics={"report_name": report_name, "status": "success"},
+        # Reports are independent read-only queries, so run them concurrently;
+        # results are still collected in the requested order
+        max_workers = max(1, min(len(report_names), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                report_name: executor.submit(
+                    self._run_report_on_table, report_name, input_rows
                 )
+                for report_name in report_names
+            }
 
+        # Each report already logged its own outcome via _StepTimer
+        for report_name, future in futures.items():
+            try:
+                results[report_name] = future.result()
+                successful_reports.append(report_name)
             except Exception as e:
-                error_msg = f"Failed to run SQL report '{report_name}': {e!s}"
-                log_pipeline_step(
-                    logger=self.logger,
-                    step="sql_report_runner",
-                    event=error_msg,
-                    metrics={"report_name": report_name, "error": str(e)},
-                    level="ERROR",
-                )
-
                 results[report_name] = {
                     "status": "failed",
                     "error": str(e),
@@ -289,31 +450,20 @@ class SQLReportRunner:
         all_reports = self.list_available_reports()
         return self.run_multiple_reports(all_reports, silver_dir, **kwargs)
 
-    @staticmethod
-    def _execute_sql_with_duckdb(df: pl.DataFrame, sql_query: str) -> pl.DataFrame:
-        """Execute SQL query using DuckDB with polars DataFrame.
+    def _execute_sql_with_duckdb(self, sql_query: str) -> pl.DataFrame:
+        """Execute SQL query on a cursor of the runner's DuckDB connection.
+
+        Each call gets its own cursor so concurrent reports do not serialize
+        on the shared connection. Results are fetched as an Arrow table and
+        handed to Polars through the Arrow C Data Interface without copying.
 
         Args:
-            df: Input polars DataFrame to be used as 'report_query' table
-            sql_query: SQL query string from .sql file
+            sql_query: SQL query string from .sql file, reading from 'report_table'
 
         Returns:
             Result DataFrame from SQL query execution
         """
-        # Create DuckDB connection (in-memory by default)
-        conn = duckdb.connect()
-
-        try:
-            # Register DataFrame as 'report_query' table in DuckDB
-
-
-            # Execute SQL query using DuckDB's native query execution
-            conn.execute('DROP VIEW IF EXISTS report_table')
-            conn.register("report_table", df)
-            result = conn.execute(sql_query).pl()
-
-            return result
-
-        finally:
-            # Clean up
-            conn.close()
+        with self.conn.cursor() as cursor:
+            arrow_table = cursor.execute(sql_query).fetch_arrow_table()
+        # Keep DuckDB's record batches as Polars chunks instead of copying them
+        return pl.from_arrow(arrow_table, rechunk=False)
@@ -1,15 +1,25 @@
 """Silver layer transformation pipeline."""
 import sys
 import time
+from datetime import date
 from pathlib import Path
 from typing import Any
 import argparse
 import polars as pl
 
-from upstream_home_test.constant import BRONZE_PATH, SILVER_LAYER, SILVER_PATH
+from upstream_home_test.constant import (
+    BRONZE_PATH,
+    SILVER_LAYER,
+    SILVER_PATH,
+    SILVER_ROW_GROUP_SIZE,
+)
 from upstream_home_test.io.parquet_writer import GenericParquetWriter, ParquetWriteError
-from upstream_home_test.schemas.silver import map_gear_position
-from upstream_home_test.utils.logging_config import log_pipeline_step, setup_logging
+from upstream_home_test.schemas.silver import SILVER_DTYPES, gear_position_expr
+from upstream_home_test.utils.logging_config import (
+    get_project_root,
+    log_pipeline_step,
+    setup_logging,
+)
 from upstream_home_test.utils.timing import elapsed_ms_since
 
 
@@ -23,8 +33,6 @@ def _resolve_paths(bronze_dir: str = None, output_path: str = None) -> tuple[str
     Returns:
         Tuple of (bronze_dir, output_path) as absolute paths
     """
-    from upstream_home_test.utils.logging_config import get_project_root
-
     project_root = get_project_root()
 
     if bronze_dir is None:
@@ -36,17 +44,20 @@ def _resolve_paths(bronze_dir: str = None, output_path: str = None) -> tuple[str
     return bronze_dir, output_path
 
 
-def _check_bronze_files_exist(bronze_dir: str, logger) -> bool:
-    """Check if Bronze parquet files exist in the directory.
+def _list_bronze_files(bronze_dir: str, logger) -> list[str]:
+    """List Bronze parquet files in the directory.
+
+    The directory is walked once; the same list is handed to the scan.
 
     Args:
-        bronze_dir: Directory to check for parquet files
+        bronze_dir: Directory to search for parquet files
         logger: Logger instance for logging
 
     Returns:
-        True if parquet files exist, False otherwise
+        Sorted list of Bronze parquet file paths (empty if none exist)
     """
-    if not any(Path(bronze_dir).rglob("*.parquet")):
+    bronze_files = sorted(str(path) for path in Path(bronze_dir).rglob("*.parquet"))
+    if not bronze_files:
         log_pipeline_step(
             logger=logger,
             step=SILVER_LAYER,
@@ -54,127 +65,135 @@ def _check_bronze_files_exist(bronze_dir: str, logger) -> bool:
             metrics={"bronze_dir": bronze_dir},
             level="WARNING",
         )
-        return False
-    return True
+    return bronze_files
+
 
+def _read_bronze_data(
+    bronze_files: list[str], logger, since: date | None = None
+) -> tuple[pl.LazyFrame, int, int]:
+    """Scan Bronze layer data lazily and filter out rows with null VIN values.
 
-def _read_bronze_data(bronze_dir: str, logger) -> pl.DataFrame:
-    """Read and validate Bronze layer data.
+    Row counts come from a single pass over the ``vin`` column, so the full
+    Bronze dataset is never materialized here. When ``since`` is given, the
+    ``date=`` hive partitions before it are pruned without opening their files.
 
     Args:
-        bronze_dir: Directory containing Bronze parquet files
+        bronze_files: Bronze parquet file paths
         logger: Logger instance for logging
+        since: Optional first Bronze partition date to include
 
     Returns:
-        Polars DataFrame with Bronze data
+        Tuple of (filtered_lazyframe, input_row_count, filtered_row_count)
 
     Raises:
-        ValueError: If no data found to transform
+        ValueError: If no data found to transform, or if ``since`` is given
+            but the Bronze files are not laid out in ``date=`` partitions
     """
-    bronze_pattern = f"{bronze_dir}/**/*.parquet"
-    df = pl.scan_parquet(bronze_pattern).collect()
-
-    if df.is_empty():
+    # Prefiltered: evaluate the vin predicate first and only decode the other
+    # columns for surviving rows
+    lf = pl.scan_parquet(bronze_files, hive_partitioning=True, parallel="prefiltered")
+    if since is not None:
+        if "date" not in lf.collect_schema():
+            raise ValueError(
+                "--since requires Bronze data partitioned by date=YYYY-MM-DD"
+            )
+        lf = lf.filter(pl.col("date") >= since)
+    # Partition keys are re-derived from the timestamp when writing Silver
+    lf = lf.drop(["date", "hour"], strict=False)
+
+    counts = lf.select(
+        pl.len().alias("input_rows"),
+        pl.col("vin").null_count().alias("null_vins"),
+    ).collect()
+    input_rows = counts["input_rows"].item()
+    filtered_rows = counts["null_vins"].item()
+
+    if input_rows == 0:
         log_pipeline_step(
             logger=logger,
             step=SILVER_LAYER,
             event="No Bronze data found to transform",
-            metrics={"bronze_dir": bronze_dir},
+            metrics={"bronze_files": len(bronze_files)},
             level="WARNING",
         )
         raise ValueError("No Bronze data found to transform")
 
-    input_rows = len(df)
-    log_pipeline_step(
-        logger=logger,
-        step=SILVER_LAYER,
-        event=f"Read {input_rows} rows from Bronze layer",
-        metrics={"input_rows": input_rows},
-    )
-
-    return df
-
-
-def _filter_null_vins(df: pl.DataFrame, logger) -> tuple[pl.DataFrame, int]:
-    """Filter out rows with null VIN values.
-
-    Args:
-        df: Input DataFrame
-        logger: Logger instance for logging
-
-    Returns:
-        Tuple of (filtered_dataframe, filtered_row_count)
-    """
-    input_rows = len(df)
-    df_filtered = df.filter(pl.col("vin").is_not_null())
-    filtered_rows = input_rows - len(df_filtered)
-
     log_pipeline_step(
         logger=logger,
         step=SILVER_LAYER,
-        event=f"Filtered {filtered_rows} rows with null VIN",
-        metrics={"filtered_rows": filtered_rows, "remaining_rows": len(df_filtered)},
+        event="Read %d rows from Bronze layer, filtered %d rows with null VIN",
+        event_args=(input_rows, filtered_rows),
+        metrics={
+            "input_rows": input_rows,
+            "filtered_rows": filtered_rows,
+            "remaining_rows": input_rows - filtered_rows,
+        },
     )
 
-    return df_filtered, filtered_rows
+    return lf.filter(pl.col("vin").is_not_null()), input_rows, filtered_rows
 
 
-def _apply_data_transformations(df: pl.DataFrame, logger) -> pl.DataFrame:
-    """Apply all data transformations to the DataFrame.
+def _apply_data_transformations(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """Apply all data transformations to the lazy Bronze scan.
 
     Args:
-        df: Input DataFrame
-        logger: Logger instance for logging
+        lf: Input LazyFrame
 
     Returns:
-        Transformed DataFrame
+        Transformed LazyFrame
     """
-    log_pipeline_step(
-        logger=logger,
-        step=SILVER_LAYER,
-        event="Applying data transformations",
-        metrics={"input_rows": len(df)},
-    )
-
-    # Create derived columns and drop specified raw columns
-    df_with_gear = df.with_columns(
-        [
-            # Map gear positions to integers before dropping the raw column
-            pl.col("gearPosition")
-            .map_elements(
-                map_gear_position,
-                return_dtype=pl.Int64,
-            )
-            .alias("gear_position"),
-        ]
-    )
-
-    # Apply remaining transformations
-    df_cleaned = df_with_gear.with_columns(
+    # Ensure timestamp is in UTC timezone, skipping the rewrite when Bronze
+    # already stores UTC (the Bronze validator normalizes timestamps to UTC)
+    timestamp_exprs = []
+    timestamp_tz = getattr(lf.collect_schema()["timestamp"], "time_zone", None)
+    if timestamp_tz is None:
+        timestamp_exprs.append(pl.col("timestamp").dt.replace_time_zone("UTC"))
+    elif timestamp_tz != "UTC":
+        timestamp_exprs.append(pl.col("timestamp").dt.convert_time_zone("UTC"))
+
+    # Apply all column transformations in a single projection
+    lf_cleaned = lf.with_columns(
         [
-            pl.col("frontLeftDoorState").alias("front_left_door_state"),
-            pl.col("wipersState").alias("wipers_state"),
-            pl.col("driverSeatbeltState").alias("driver_seatbelt_state"),
-            # Clean manufacturer field in place (remove trailing spaces)
-            pl.col("manufacturer").str.strip_chars().alias("manufacturer"),
-            # Ensure timestamp is in UTC timezone
-            pl.col("timestamp").dt.replace_time_zone("UTC").alias("timestamp"),
+            # Map gear positions natively (same rules as map_gear_position)
+            gear_position_expr("gearPosition").alias("gear_position"),
+            # Clean manufacturer field in place (remove trailing spaces) and
+            # dictionary-encode it, as it has very few distinct values
+            pl.col("manufacturer")
+            .str.strip_chars()
+            .cast(pl.Categorical)
+            .alias("manufacturer"),
+            *timestamp_exprs,
         ]
     )
 
-    # Drop unused columns
-    df_final = df_cleaned.drop(
-        ["gearPosition", "frontLeftDoorState", "driverSeatbeltState", "wipersState"]
+    # Renames are metadata-only; drop the raw gear column
+    lf_renamed = lf_cleaned.rename(
+        {
+            "frontLeftDoorState": "front_left_door_state",
+            "wipersState": "wipers_state",
+            "driverSeatbeltState": "driver_seatbelt_state",
+        }
+    ).drop("gearPosition")
+
+    # Give all-null columns their declared type, so no Silver file is written
+    # with Null-typed columns that clash with typed ones in other files
+    null_columns = [
+        name
+        for name, dtype in lf_renamed.collect_schema().items()
+        if dtype == pl.Null and name in SILVER_DTYPES
+    ]
+    if not null_columns:
+        return lf_renamed
+    return lf_renamed.with_columns(
+        pl.col(name).cast(SILVER_DTYPES[name]) for name in null_columns
     )
 
-    return df_final
 
-
-def _write_silver_data(df: pl.DataFrame, output_path: str, logger) -> dict[str, Any]:
-    """Write transformed data to Silver layer.
+def _write_silver_data(lf: pl.LazyFrame, output_path: str, logger) -> dict[str, Any]:
+    """Stream transformed data to the Silver layer.
 
     Args:
-        df: Transformed DataFrame to write
+        lf: Transformed LazyFrame to write
         output_path: Output directory path
         logger: Logger instance for logging
 
@@ -185,7 +204,7 @@ def _write_silver_data(df: pl.DataFrame, output_path: str, logger) -> dict[str,
         logger=logger,
         step=SILVER_LAYER,
         event="Writing cleaned data to Silver layer",
-        metrics={"output_rows": len(df)},
+        metrics={"output_path": output_path},
     )
 
     # Create generic parquet writer for Silver layer with partitioning (same as Bronze)
@@ -194,9 +213,13 @@ def _write_silver_data(df: pl.DataFrame, output_path: str, logger) -> dict[str,
         partitioning_enabled=True,
         compression="zstd",
         logger=logger,
+        row_group_size=SILVER_ROW_GROUP_SIZE,
+        compression_level=3,
+        data_page_size=1 << 20,
     )
 
-    return writer.write(df)
+    # Cluster rows so per-row-group min/max statistics can prune report scans
+    return writer.sink(lf, sort_by=["manufacturer", "timestamp"])
 
 
 def _create_empty_result() -> dict[str, Any]:
@@ -215,7 +238,9 @@ def _create_empty_result() -> dict[str, Any]:
 
 
 def run_silver_transform(
-    bronze_dir: str | None = None, output_path: str | None = None
+    bronze_dir: str | None = None,
+    output_path: str | None = None,
+    since: date | None = None,
 ) -> dict[str, Any]:
     """Run the complete Silver layer transformation pipeline.
 
@@ -229,6 +254,8 @@ def run_silver_transform(
     Args:
         bronze_dir: Directory containing Bronze layer Parquet files
         output_path: Output path for Silver layer Parquet file
+        since: Only transform Bronze partitions dated on or after this day
+            (None transforms everything)
 
     Returns:
         Dictionary with transformation statistics
@@ -242,36 +269,41 @@ def run_silver_transform(
     # Set up logging
     logger = setup_logging(clear_log_file=False)
 
-    pipeline_start = time.time()
+    pipeline_start = time.perf_counter_ns()
 
     try:
-        # Step 1: Check if Bronze files exist
+        # Step 1: List Bronze files (single directory walk)
         log_pipeline_step(
             logger=logger,
             step=SILVER_LAYER,
             event="Starting Silver layer transformation",
-            metrics={"bronze_dir": bronze_dir, "output_path": output_path},
+            metrics={
+                "bronze_dir": bronze_dir,
+                "output_path": output_path,
+                "since": since.isoformat() if since else None,
+            },
         )
 
-        if not _check_bronze_files_exist(bronze_dir, logger):
+        bronze_files = _list_bronze_files(bronze_dir, logger)
+        if not bronze_files:
             return _create_empty_result()
 
-        # Step 2: Read Bronze data
+        # Step 2: Scan Bronze data and filter null VINs (lazy)
         try:
-            df = _read_bronze_data(bronze_dir, logger)
+            lf_filtered, input_rows, filtered_rows = _read_bronze_data(
+                bronze_files, logger, since
+            )
         except ValueError as e:
             if "No Bronze data found to transform" in str(e):
                 return _create_empty_result()
             raise
 
-        # Step 3: Filter null VINs
-        df_filtered, filtered_rows = _filter_null_vins(df, logger)
-
-        # Step 4: Apply transformations
-        df_cleaned = _apply_data_transformations(df_filtered, logger)
+        # Step 3: Apply transformations (lazy)
+        lf_cleaned = _apply_data_transformations(lf_filtered)
 
-        # Step 5: Write to Silver layer
-        write_stats = _write_silver_data(df_cleaned, output_path, logger)
+        # Step 4: Stream to Silver layer
+        write_stats = _write_silver_data(lf_cleaned, output_path, logger)
+        output_rows = write_stats["rows"]
 
         # Calculate total duration
         total_duration_ms = elapsed_ms_since(pipeline_start)
@@ -282,18 +314,18 @@ def run_silver_transform(
             step=SILVER_LAYER,
             event="Silver layer transformation completed successfully",
             metrics={
-                "input_rows": len(df),
+                "input_rows": input_rows,
                 "filtered_rows": filtered_rows,
-                "output_rows": len(df_cleaned),
+                "output_rows": output_rows,
                 "total_duration_ms": round(total_duration_ms, 2),
             },
         )
 
         return {
             "status": "completed",
-            "input_rows": len(df),
+            "input_rows": input_rows,
             "filtered_rows": filtered_rows,
-            "output_rows": len(df_cleaned),
+            "output_rows": output_rows,
             "duration_ms": round(total_duration_ms, 2),
         }
 
@@ -341,10 +373,16 @@ def main() -> None:
             default=SILVER_PATH,
             help="Output directory for Silver parquet files",
         )
+        parser.add_argument(
+            "--since",
+            type=date.fromisoformat,
+            default=None,
+            help="Only transform Bronze partitions on or after this date (YYYY-MM-DD)",
+        )
         args = parser.parse_args()
 
         # Run pipeline
-        result = run_silver_transform(args.bronze_dir, args.output_path)
+        result = run_silver_transform(args.bronze_dir, args.output_path, args.since)
 
         # Print results
         print("Silver transformation completed successfully!")
@@ -3,8 +3,12 @@
 from datetime import datetime
 from enum import IntEnum
 
+import polars as pl
 from pydantic import BaseModel, ConfigDict, field_validator
 
+# Allowed standardized gear positions (see GearPosition)
+_VALID_GEAR_POSITIONS = frozenset(range(-1, 7))
+
 
 class VehicleMessageCleaned(BaseModel):
     """Cleaned vehicle message schema for Silver layer.
@@ -19,7 +23,7 @@ class VehicleMessageCleaned(BaseModel):
     manufacturer: str | None
     year: int | None = None
     model: str | None = None
-    gear_position: int | None  # Standardized gear position as integer
+    gear_position: int | None  # Standardized gear position (Int8 in Silver files)
     velocity: int | None = None
     front_left_door_state: str | None = None
     wipers_state: bool | None = None
@@ -47,7 +51,7 @@ class VehicleMessageCleaned(BaseModel):
         Raises:
             ValueError: If gear position is invalid
         """
-        if v is not None and v not in {-1, 0, 1, 2, 3, 4, 5, 6, None}:
+        if v is not None and v not in _VALID_GEAR_POSITIONS:
             raise ValueError(f"Gear position must be -1 to 6,null got {v}")
         return v
 
@@ -82,7 +86,8 @@ class VehicleMessageCleaned(BaseModel):
         """
         if v is None:
             return v
-        return v.strip() if v.strip() else None
+        stripped = v.strip()
+        return stripped or None
 
     @field_validator("speed", "fuel_level", "engine_temp")
     @classmethod
@@ -121,6 +126,30 @@ class VehicleMessageCleaned(BaseModel):
         return v
 
 
+# Polars dtypes of the Silver columns (mirrors reports/silver_schema.json).
+# Bronze files leave all-null columns as Polars' Null type; Silver casts them
+# to these so every file carries the same column types.
+SILVER_DTYPES: dict[str, pl.DataType] = {
+    "vin": pl.String(),
+    "manufacturer": pl.Categorical(),
+    "year": pl.Int64(),
+    "model": pl.String(),
+    "velocity": pl.Int64(),
+    "timestamp": pl.Datetime("us", "UTC"),
+    "speed": pl.Float64(),
+    "rpm": pl.Int64(),
+    "fuel_level": pl.Float64(),
+    "engine_temp": pl.Float64(),
+    "latitude": pl.Float64(),
+    "longitude": pl.Float64(),
+    "altitude": pl.Float64(),
+    "gear_position": pl.Int8(),
+    "front_left_door_state": pl.String(),
+    "wipers_state": pl.Boolean(),
+    "driver_seatbelt_state": pl.String(),
+}
+
+
 # Gear position enum with all available options
 class GearPosition(IntEnum):
     """Standardized gear position enum with all available options."""
@@ -164,6 +193,13 @@ GEAR_POSITION_MAPPING = {
     "NULL": GearPosition.UNKNOWN,
 }
 
+# Same mapping with plain int values, for vectorized Polars expressions and
+# scalar lookups
+GEAR_POSITION_INT_MAPPING = {
+    code: int(position) for code, position in GEAR_POSITION_MAPPING.items()
+}
+_UNKNOWN_GEAR_POSITION = int(GearPosition.UNKNOWN)
+
 
 def map_gear_position(gear_str: str | None) -> int | None:
     """Map gear position string to standardized integer.
@@ -185,11 +221,29 @@ def map_gear_position(gear_str: str | None) -> int | None:
     if gear_str is None:
         return None
 
-    gear_str = gear_str.strip().upper()
-    mapped_value = GEAR_POSITION_MAPPING.get(gear_str)
+    # Codes not found in the mapping are unknown
+    return GEAR_POSITION_INT_MAPPING.get(
+        gear_str.strip().upper(), _UNKNOWN_GEAR_POSITION
+    )
 
-    if mapped_value is not None:
-        return mapped_value.value
 
-    # If not found in mapping, return unknown
-    return GearPosition.UNKNOWN.value
+def gear_position_expr(column: str) -> pl.Expr:
+    """Build a vectorized Polars expression equivalent to map_gear_position.
+
+    Args:
+        column: Name of the column holding raw gear position codes
+
+    Returns:
+        Int8 expression: codes are stripped and uppercased, unknown codes map
+        to -1 and nulls stay null
+    """
+    gear = pl.col(column).cast(pl.String)
+    return (
+        gear.str.strip_chars()
+        .str.to_uppercase()
+        .replace_strict(
+            GEAR_POSITION_INT_MAPPING,
+            default=pl.when(gear.is_not_null()).then(pl.lit(_UNKNOWN_GEAR_POSITION)),
+            return_dtype=pl.Int8,
+        )
+    )
@@ -1,13 +1,27 @@
 """Structured JSON logging configuration for the data pipeline."""
 
+import atexit
 import json
 import logging
+import queue
 import sys
 from datetime import UTC, datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any
 
+# Level names accepted by log_pipeline_step, resolved once at import
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 
+
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Get the project root directory (where pyproject.toml is located)."""
     current_file = Path(__file__).resolve()
@@ -18,10 +32,26 @@ def get_project_root() -> Path:
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
 
+    # (epoch second, ISO prefix) of the last formatted record; records arrive
+    # many per second, so the date/time part is usually reused as-is
+    _last_second: tuple[int, str] = (-1, "")
+
+    def _format_timestamp(self, created: float) -> str:
+        """Format a record creation time as an ISO-8601 UTC string."""
+        second = int(created)
+        cached_second, prefix = JSONFormatter._last_second
+        if second != cached_second:
+            prefix = datetime.fromtimestamp(second, UTC).strftime(
+                "%Y-%m-%dT%H:%M:%S"
+            )
+            JSONFormatter._last_second = (second, prefix)
+        micros = min(round((created - second) * 1_000_000), 999_999)
+        return f"{prefix}.{micros:06d}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_entry = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "event": record.getMessage(),
             "step": getattr(record, "step", "unknown"),
@@ -32,7 +62,33 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_entry, ensure_ascii=False)
+        return json.dumps(log_entry, ensure_ascii=False, default=str)
+
+
+class _PassthroughQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the listener's handlers.
+
+    The stock ``prepare`` pre-formats the message and drops ``exc_info``,
+    which would hide exceptions from JSONFormatter.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Enqueue the record unchanged."""
+        return record
+
+
+# Background listener writing the pipeline log file (see setup_logging)
+_queue_listener: QueueListener | None = None
+
+
+def _stop_queue_listener() -> None:
+    """Stop the log file listener, flushing any pending records."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
 
 
 def setup_logging(
@@ -40,6 +96,10 @@ def setup_logging(
 ) -> logging.Logger:
     """Set up structured JSON logging for the pipeline.
 
+    Console output is written synchronously so it stays ordered with the
+    callers' own prints. Log file records are put on an in-memory queue and
+    written by a background listener, so logging calls never block on disk I/O.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         clear_log_file: Whether to clear the existing log file (default: True)
@@ -56,13 +116,13 @@ def setup_logging(
     logger = logging.getLogger("upstream_home_test")
     logger.setLevel(getattr(logging, log_level.upper()))
 
-    # Clear any existing handlers
+    # Flush and clear any existing handlers
+    _stop_queue_listener()
     logger.handlers.clear()
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(JSONFormatter())
-    logger.addHandler(console_handler)
 
     # File handler - optionally clear log file
     log_file_path = logs_dir / "pipeline.log"
@@ -71,7 +131,14 @@ def setup_logging(
 
     file_handler = logging.FileHandler(log_file_path)
     file_handler.setFormatter(JSONFormatter())
-    logger.addHandler(file_handler)
+
+    # Hand file records to a background thread that formats and writes them
+    global _queue_listener
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _queue_listener.start()
+    logger.addHandler(console_handler)
+    logger.addHandler(_PassthroughQueueHandler(log_queue))
 
     return logger
 
@@ -82,24 +149,36 @@ def log_pipeline_step(
     event: str,
     metrics: dict[str, Any] | None = None,
     level: str = "INFO",
+    event_args: tuple[Any, ...] = (),
 ) -> None:
     """Log a pipeline step with structured data.
 
     Args:
         logger: Logger instance (can be None for testing)
         step: Pipeline step name
-        event: Event description
+        event: Event description, optionally a %-style template
         metrics: Optional metrics dictionary
         level: Log level
+        event_args: Arguments for the event template; formatting is deferred
+            until a handler actually emits the record
     """
     if logger is None:
         # Skip logging if no logger provided (useful for testing)
         return
 
+    log_level = _LEVELS.get(level) or _LEVELS[level.upper()]
+    if not logger.isEnabledFor(log_level):
+        return
+
     extra = {
         "step": step,
         "metrics": metrics or {},
     }
 
-    log_level = getattr(logging, level.upper())
-    logger.log(log_level, event, extra=extra)
+    logger.log(log_level, event, *event_args, extra=extra)
+
+
+@atexit.register
+def _flush_pipeline_logs() -> None:
+    """Drain queued log records before the interpreter exits."""
+    _stop_queue_listener()
@@ -3,11 +3,35 @@ from typing import Any
 from upstream_home_test.utils.logging_config import log_pipeline_step
 
 
+# Number of leading messages used to estimate the average row size
+_SIZE_SAMPLE_ROWS = 1024
+
+
+def _estimate_row_bytes(message: dict[str, Any]) -> int:
+    """Estimate the serialized size of one message in bytes.
+
+    Args:
+        message: Message dictionary
+
+    Returns:
+        Approximate ``json.dumps(message, default=str)`` size of the message
+        (quoted keys, values and separators)
+    """
+    size = 0
+    for key, value in message.items():
+        # '"key": ' plus the ', ' separator
+        size += len(key) + 6 + len(str(value))
+        if value is not None and not isinstance(value, (int, float)):
+            size += 2  # Quotes around strings and str()-serialized values
+    return size
+
+
 def estimate_parquet_size_mb(messages: list[dict[str, Any]]) -> float:
     """Estimate the size of messages when written as Parquet.
 
-    This is a rough estimation based on JSON serialization size.
-    Actual Parquet size will be smaller due to compression.
+    This is a rough estimation based on the serialized size of a sample of
+    messages, scaled to the full list. Actual Parquet size will be smaller
+    due to compression.
 
     Args:
         messages: List of message dictionaries
@@ -18,11 +42,11 @@ def estimate_parquet_size_mb(messages: list[dict[str, Any]]) -> float:
     if not messages:
         return 0.0
 
-    # Rough estimation: JSON size * 0.3 (typical Parquet compression ratio)
-    import json
+    sample = messages[:_SIZE_SAMPLE_ROWS]
+    avg_row_bytes = sum(map(_estimate_row_bytes, sample)) / len(sample)
 
-    json_size_bytes = len(json.dumps(messages, default=str))
-    estimated_parquet_bytes = json_size_bytes * 0.3
+    # Rough estimation: serialized size * 0.3 (typical Parquet compression ratio)
+    estimated_parquet_bytes = avg_row_bytes * len(messages) * 0.3
 
     return estimated_parquet_bytes / (1024 * 1024)  # Convert to MB
 
@@ -61,7 +85,7 @@ def split_by_size(
 
     # Calculate number of chunks needed
     num_chunks = int(total_size_mb / max_size_mb) + 1
-    chunk_size = len(messages) // num_chunks
+    chunk_size = max(1, len(messages) // num_chunks)
 
     # Split messages into chunks
     chunks = []
@@ -70,8 +94,10 @@ def split_by_size(
         if chunk:  # Only add non-empty chunks
             chunks.append(chunk)
 
-    # Log splitting results
-    chunk_sizes = [estimate_parquet_size_mb(chunk) for chunk in chunks]
+    # Log splitting results; the estimate is linear in row count, so each
+    # chunk's share follows from the total without re-estimating it
+    mb_per_message = total_size_mb / len(messages)
+    chunk_sizes = [len(chunk) * mb_per_message for chunk in chunks]
     log_pipeline_step(
         logger=None,
         step="size_splitting",
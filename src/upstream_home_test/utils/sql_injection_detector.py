@@ -1,16 +1,21 @@
 """This module provides functionality to detect potential SQL injection patterns
 in the bronze layer data using DuckDB and regex pattern matching.
 """
+import io
 import json
+import os
 import sys
+import time
 import argparse
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import duckdb
 import polars as pl
 from pydantic import BaseModel
 from upstream_home_test.constant import BRONZE_PATH
+from upstream_home_test.utils.timing import elapsed_ms_since
 
 
 class SQLInjectionResult(BaseModel):
@@ -51,10 +56,536 @@ class SQLInjectionReport(BaseModel):
     scan_duration_ms: float
 
 
+def _validate_patterns(
+    conn: duckdb.DuckDBPyConnection, injection_patterns: list[str]
+) -> list[tuple[int, str]]:
+    """Compile each pattern once with DuckDB's regex engine.
+
+    Invalid patterns are reported and skipped so that one bad pattern does
+    not abort the combined scan for the others.
+
+    Args:
+        conn: DuckDB connection
+        injection_patterns: Regex patterns to validate
+
+    Returns:
+        List of (pattern index, pattern) pairs that compiled successfully
+    """
+    valid_patterns = []
+    for i, pattern in enumerate(injection_patterns):
+        try:
+            conn.execute("SELECT regexp_matches('', ?)", [pattern])
+        except duckdb.Error as e:
+            print(f"Warning: Skipping invalid pattern {i+1} '{pattern}': {e}")
+            continue
+        valid_patterns.append((i, pattern))
+    return valid_patterns
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a column name for use as a DuckDB identifier.
+
+    Args:
+        name: Column name as read from the parquet schema
+
+    Returns:
+        Double-quoted identifier with embedded quotes escaped
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _build_scan_query(
+    columns: list[str], patterns: list[tuple[int, str]], limited: bool = False
+) -> str:
+    """Build one query that checks every column against every pattern.
+
+    Only the checked columns are read. Each column is first filtered with a
+    single alternation of all patterns, so most rows are rejected by one regex
+    evaluation. Surviving values are then tested per pattern to report which
+    patterns matched. The file paths and patterns are bound as parameters
+    (see _scan_parameters) rather than inlined as SQL literals.
+
+    Args:
+        columns: Columns present in every scanned file to check
+        patterns: (pattern index, pattern) pairs to match
+        limited: Return at most $max_violations matches, in no particular
+            order, so the scan can stop early
+
+    Returns:
+        SQL query returning (__file_path, __row_index, __column_idx,
+        __pattern_idx) for each (row, column, pattern) match
+    """
+    # Column names are only ever taken from the files' own schemas (see
+    # _scan_all_files) and are quoted as identifiers, never as raw SQL
+    identifiers = [_quote_identifier(column) for column in columns]
+    column_hits = "\n            UNION ALL\n".join(
+        f"""
+            SELECT __file_path, __row_index, {column_idx} AS __column_idx,
+                {identifier}::VARCHAR AS __match_value
+            FROM src
+            WHERE {identifier} IS NOT NULL
+            AND regexp_matches({identifier}::VARCHAR, $combined_pattern)"""
+        for column_idx, identifier in enumerate(identifiers)
+    )
+    pattern_checks = ", ".join(
+        f"CASE WHEN regexp_matches(hits.__match_value, $pattern_{pattern_idx}) "
+        f"THEN {pattern_idx} END"
+        for pattern_idx, _ in patterns
+    )
+
+    # Ordering needs every match; a bare LIMIT lets DuckDB stop at the first n
+    tail = (
+        "LIMIT $max_violations"
+        if limited
+        else "ORDER BY __file_path, __row_index, __column_idx, __pattern_idx"
+    )
+    projection = ", ".join(identifiers)
+
+    return f"""
+    WITH src AS (
+        SELECT
+            filename AS __file_path,
+            file_row_number AS __row_index,
+            {projection}
+        FROM read_parquet(
+            $file_paths, filename = true, file_row_number = true, union_by_name = true
+        )
+    ),
+    hits AS ({column_hits}
+    )
+    SELECT
+        __file_path,
+        __row_index,
+        __column_idx,
+        UNNEST(list_filter([{pattern_checks}], x -> x IS NOT NULL))
+            AS __pattern_idx
+    FROM hits
+    {tail}
+    """
+
+
+# Fetches the full rows of matches found by the scan query, reading only the
+# files that had matches
+_MESSAGE_QUERY = """
+    SELECT hits.*, src.* EXCLUDE (__file_path, __row_index)
+    FROM __scan_hits AS hits
+    JOIN (
+        SELECT
+            filename AS __file_path,
+            file_row_number AS __row_index,
+            * EXCLUDE (filename, file_row_number)
+        FROM read_parquet(
+            $file_paths, filename = true, file_row_number = true, union_by_name = true
+        )
+    ) AS src USING (__file_path, __row_index)
+    ORDER BY __file_path, __row_index, __column_idx, __pattern_idx
+"""
+
+
+def _scan_parameters(patterns: list[tuple[int, str]]) -> dict[str, str]:
+    """Build the pattern parameters shared by every file's scan query.
+
+    Args:
+        patterns: (pattern index, pattern) pairs to match
+
+    Returns:
+        Named parameters for _build_scan_query, without file_paths
+    """
+    parameters = {
+        "combined_pattern": "|".join(f"(?:{pattern})" for _, pattern in patterns)
+    }
+    for pattern_idx, pattern in patterns:
+        parameters[f"pattern_{pattern_idx}"] = pattern
+    return parameters
+
+
+def _read_file_columns(
+    conn: duckdb.DuckDBPyConnection, file_paths: list[str]
+) -> dict[str, tuple[str, ...]]:
+    """Read the top-level column names of many parquet files in one call.
+
+    Args:
+        conn: DuckDB connection
+        file_paths: Parquet files to inspect
+
+    Returns:
+        Mapping of file path to its top-level column names
+    """
+    schema_rows = conn.execute(
+        "SELECT file_name, name, num_children FROM parquet_schema(?)", [file_paths]
+    ).fetchall()
+
+    file_columns: dict[str, list[str]] = {}
+    open_groups: dict[str, list[int]] = {}
+    for file_name, name, num_children in schema_rows:
+        groups = open_groups.setdefault(file_name, [])
+        if not groups:
+            # Root element: its children are the top-level columns
+            file_columns[file_name] = []
+            groups.append(num_children or 0)
+            continue
+        if len(groups) == 1:
+            file_columns[file_name].append(name)
+        groups[-1] -= 1
+        if num_children:
+            groups.append(num_children)
+        # Close nested groups whose children have all been seen
+        while len(groups) > 1 and groups[-1] == 0:
+            groups.pop()
+
+    return {file_name: tuple(columns) for file_name, columns in file_columns.items()}
+
+
+def _read_null_columns(
+    conn: duckdb.DuckDBPyConnection, file_paths: list[str]
+) -> dict[str, set[str]]:
+    """Find columns that footer statistics show to be entirely NULL.
+
+    Args:
+        conn: DuckDB connection
+        file_paths: Parquet files to inspect
+
+    Returns:
+        Mapping of file path to the columns holding no non-NULL values in any
+        row group. Columns without null-count statistics are never included.
+    """
+    null_columns: dict[str, set[str]] = {}
+    for file_name, column in conn.execute(
+        """
+        SELECT file_name, path_in_schema
+        FROM parquet_metadata(?)
+        GROUP BY file_name, path_in_schema
+        HAVING bool_and(coalesce(stats_null_count = num_values, false))
+        """,
+        [file_paths],
+    ).fetchall():
+        null_columns.setdefault(file_name, set()).add(column)
+    return null_columns
+
+
+def _count_file_rows(
+    conn: duckdb.DuckDBPyConnection, file_paths: list[str]
+) -> dict[str, int]:
+    """Count rows of each parquet file from its footer.
+
+    If the footers cannot be read together, files are counted one at a time
+    and unreadable files are left out of the result.
+
+    Args:
+        conn: DuckDB connection
+        file_paths: Parquet files to count
+
+    Returns:
+        Mapping of file path to row count, without decoding any column data
+    """
+    query = "SELECT file_name, num_rows FROM parquet_file_metadata(?)"
+    try:
+        return dict(conn.execute(query, [file_paths]).fetchall())
+    except duckdb.Error:
+        # Fall back to reading footers file by file
+        file_rows = {}
+        for file_path_str in file_paths:
+            try:
+                file_rows.update(conn.execute(query, [[file_path_str]]).fetchall())
+            except duckdb.Error as e:
+                print(f"Warning: Error scanning file '{file_path_str}': {e}")
+        return file_rows
+
+
+def _scan_files(
+    conn: duckdb.DuckDBPyConnection,
+    file_paths: list[str],
+    columns: list[str],
+    patterns: list[tuple[int, str]],
+    parameters: dict[str, str],
+    max_violations: Optional[int] = None,
+) -> list[SQLInjectionResult]:
+    """Scan parquet files sharing a schema for all columns and patterns at once.
+
+    Args:
+        conn: DuckDB connection
+        file_paths: Parquet files to scan, all containing ``columns``
+        columns: Column names to check
+        patterns: (pattern index, pattern) pairs that compiled successfully
+        parameters: Pattern parameters from _scan_parameters
+        max_violations: Stop after this many violations (None scans everything)
+
+    Returns:
+        Violations found in the files
+
+    Raises:
+        duckdb.Error: If the files cannot be scanned
+    """
+    query_parameters: dict[str, Any] = {**parameters, "file_paths": file_paths}
+    if max_violations is not None:
+        query_parameters["max_violations"] = max_violations
+    hits = conn.execute(
+        _build_scan_query(columns, patterns, limited=max_violations is not None),
+        query_parameters,
+    ).fetch_arrow_table()
+    if hits.num_rows == 0:
+        return []
+
+    # Decode full rows only for the matches
+    hit_files = sorted(set(hits.column("__file_path").to_pylist()))
+    conn.register("__scan_hits", hits)
+    try:
+        # Fetch as Arrow and convert column by column rather than row tuples
+        table = conn.execute(
+            _MESSAGE_QUERY, {"file_paths": hit_files}
+        ).fetch_arrow_table()
+    finally:
+        conn.unregister("__scan_hits")
+    helper_columns = table.select(
+        ["__file_path", "__column_idx", "__pattern_idx", "__row_index"]
+    ).to_pydict()
+    message_names = [name for name in table.column_names if not name.startswith("__")]
+    message_rows = zip(*(table.column(name).to_pylist() for name in message_names))
+
+    pattern_by_idx = dict(patterns)
+    violations = []
+    for file_path_str, column_idx, pattern_idx, row_index, values in zip(
+        helper_columns["__file_path"],
+        helper_columns["__column_idx"],
+        helper_columns["__pattern_idx"],
+        helper_columns["__row_index"],
+        message_rows,
+    ):
+        row_dict = dict(zip(message_names, values))
+        # Serialize full message to JSON (best-effort via str())
+        safe_row = {
+            k: (v.isoformat() if hasattr(v, "isoformat") else str(v))
+            for k, v in row_dict.items()
+        }
+        message_json = json.dumps(safe_row, ensure_ascii=False)
+        # Values come typed from DuckDB, so skip re-validating each result
+        violations.append(
+            SQLInjectionResult.model_construct(
+                file_path=file_path_str,
+                row_index=int(row_index),
+                column_name=columns[column_idx],
+                column_value=str(row_dict[columns[column_idx]]),
+                matched_pattern=pattern_by_idx[pattern_idx],
+                message_json=message_json,
+            )
+        )
+    return violations
+
+
+def _scan_all_files(
+    conn: duckdb.DuckDBPyConnection,
+    file_paths: list[str],
+    columns_to_check: list[str],
+    patterns: list[tuple[int, str]],
+    parameters: dict[str, str],
+    max_violations: Optional[int] = None,
+) -> list[SQLInjectionResult]:
+    """Scan all parquet files, one query per group of files sharing a schema.
+
+    Files with the same columns are read by a single ``read_parquet`` call so
+    DuckDB can parallelize across them. If a group fails, its files are
+    retried one at a time so a single unreadable file only skips itself.
+
+    Args:
+        conn: DuckDB connection
+        file_paths: Parquet files to scan
+        columns_to_check: Column names to check
+        patterns: (pattern index, pattern) pairs that compiled successfully
+        parameters: Pattern parameters from _scan_parameters
+        max_violations: Stop after this many violations (None scans everything)
+
+    Returns:
+        Violations found across all files
+    """
+    try:
+        file_columns = _read_file_columns(conn, file_paths)
+    except duckdb.Error:
+        # Fall back to reading schemas file by file
+        file_columns = {}
+        for file_path_str in file_paths:
+            try:
+                file_columns.update(_read_file_columns(conn, [file_path_str]))
+            except duckdb.Error as e:
+                print(f"Warning: Error scanning file '{file_path_str}': {e}")
+
+    try:
+        null_columns = _read_null_columns(conn, list(file_columns))
+    except duckdb.Error:
+        # Statistics only prune work; scan every column without them
+        null_columns = {}
+
+    # Group files by their full column list (so a union_by_name read never
+    # adds another file's columns to a message) and by the checked columns
+    # they contain, leaving out columns that hold no values and cannot match
+    groups: dict[tuple[tuple[str, ...], tuple[str, ...]], list[str]] = {}
+    for file_path_str in file_paths:
+        if file_path_str not in file_columns:
+            continue
+        present = set(file_columns[file_path_str])
+        empty = null_columns.get(file_path_str, set())
+        columns = []
+        for column in columns_to_check:
+            if column not in present:
+                print(
+                    f"Warning: Column '{column}' not found in file '{file_path_str}'"
+                )
+            elif column not in empty:
+                columns.append(column)
+        if columns:
+            groups.setdefault(
+                (file_columns[file_path_str], tuple(columns)), []
+            ).append(file_path_str)
+
+    violations: list[SQLInjectionResult] = []
+
+    def remaining() -> Optional[int]:
+        """Violations still allowed before stopping (None when unlimited)."""
+        return None if max_violations is None else max_violations - len(violations)
+
+    for (_, columns), group_files in groups.items():
+        if remaining() == 0:
+            break
+        try:
+            violations.extend(
+                _scan_files(
+                    conn, group_files, list(columns), patterns, parameters, remaining()
+                )
+            )
+        except duckdb.Error:
+            # Retry file by file to isolate the failing file(s)
+            for file_path_str in group_files:
+                if remaining() == 0:
+                    break
+                try:
+                    violations.extend(
+                        _scan_files(
+                            conn,
+                            [file_path_str],
+                            list(columns),
+                            patterns,
+                            parameters,
+                            remaining(),
+                        )
+                    )
+                except duckdb.Error as e:
+                    # Log the error but continue with other files
+                    print(f"Warning: Error scanning file '{file_path_str}': {e}")
+
+    # Each query is ordered by file; keep that order across schema groups
+    violations.sort(key=lambda violation: (violation.file_path, violation.row_index))
+    return violations
+
+
+def _find_parquet_files(
+    columns_to_check: list[str], injection_patterns: list[str], data_path: str
+) -> list[str]:
+    """Validate scan inputs and list the parquet files to scan.
+
+    Args:
+        columns_to_check: Column names to check
+        injection_patterns: Regex patterns to match
+        data_path: Path to the data directory containing parquet files
+
+    Returns:
+        Sorted parquet file paths under data_path
+
+    Raises:
+        FileNotFoundError: If data directory doesn't exist
+        ValueError: If columns_to_check or injection_patterns are empty
+    """
+    if not columns_to_check:
+        raise ValueError("columns_to_check cannot be empty")
+
+    if not injection_patterns:
+        raise ValueError("injection_patterns cannot be empty")
+
+    data_path_obj = Path(data_path)
+    if not data_path_obj.exists():
+        raise FileNotFoundError(f"Data directory not found: {data_path}")
+
+    return [str(file_path) for file_path in sorted(data_path_obj.rglob("*.parquet"))]
+
+
+@lru_cache(maxsize=1)
+def _get_connection() -> duckdb.DuckDBPyConnection:
+    """Return the process-wide DuckDB connection used for injection scans.
+
+    Reusing one database instance keeps parquet footers (object cache) and
+    file pages (external file cache) warm across repeated reports. Callers
+    should work on a cursor of this connection rather than the connection
+    itself.
+
+    Returns:
+        Shared in-memory DuckDB connection
+    """
+    # Use every available core; results are explicitly ordered, so scans need
+    # not preserve insertion order
+    conn = duckdb.connect(
+        config={"threads": os.cpu_count() or 1, "preserve_insertion_order": False}
+    )
+    conn.execute("PRAGMA enable_object_cache")
+    conn.execute("SET enable_external_file_cache = true")
+    return conn
+
+
+def _scan_parquet_files(
+    file_paths: list[str],
+    columns_to_check: list[str],
+    injection_patterns: list[str],
+    count_paths: Optional[list[str]] = None,
+    max_violations: Optional[int] = None,
+) -> tuple[dict[str, int], list[SQLInjectionResult]]:
+    """Count rows and find violations in the given parquet files.
+
+    Files whose footer cannot be read are skipped with a warning.
+
+    Args:
+        file_paths: Parquet files to scan for violations
+        columns_to_check: Column names to check
+        injection_patterns: Regex patterns to match
+        count_paths: Files to count rows for (defaults to file_paths)
+        max_violations: Stop after this many violations (None finds all)
+
+    Returns:
+        Tuple of (row count per counted file, violations found)
+    """
+    count_paths = file_paths if count_paths is None else count_paths
+
+    # A cursor on the shared connection keeps its caches across reports
+    conn = _get_connection().cursor()
+    violations: list[SQLInjectionResult] = []
+
+    try:
+        file_rows = _count_file_rows(conn, count_paths) if count_paths else {}
+        # Unreadable files were reported while counting; do not scan them
+        unreadable = set(count_paths).difference(file_rows)
+        file_paths = [
+            file_path_str
+            for file_path_str in file_paths
+            if file_path_str not in unreadable
+        ]
+
+        valid_patterns = _validate_patterns(conn, injection_patterns)
+        if valid_patterns and file_paths:
+            violations = _scan_all_files(
+                conn,
+                file_paths,
+                columns_to_check,
+                valid_patterns,
+                _scan_parameters(valid_patterns),
+                max_violations,
+            )
+    finally:
+        conn.close()
+
+    return file_rows, violations
+
+
 def sql_injection_report(
     columns_to_check: list[str],
     injection_patterns: list[str],
     data_path: str = BRONZE_PATH,
+    max_violations: Optional[int] = None,
 ) -> SQLInjectionReport:
     """Detect potential SQL injection patterns.
 
@@ -66,6 +597,8 @@ def sql_injection_report(
         columns_to_check: List of column names to check for SQL injection patterns
         injection_patterns: List of regex patterns to detect SQL injection attempts
         data_path: Path to the data directory containing parquet files
+        max_violations: Stop scanning once this many violations are found; use
+            when only the presence of violations matters (None finds all)
 
     Returns:
         SQLInjectionReport containing all detected violations and scan statistics
@@ -75,24 +608,11 @@ def sql_injection_report(
         ValueError: If columns_to_check or injection_patterns are empty
         Exception: If there's an error during the scan process
     """
-    import time
-
-    start_time = time.time()
-
-    # Validate inputs
-    if not columns_to_check:
-        raise ValueError("columns_to_check cannot be empty")
-
-    if not injection_patterns:
-        raise ValueError("injection_patterns cannot be empty")
-
-    data_path_obj = Path(data_path)
-    if not data_path_obj.exists():
-        raise FileNotFoundError(f"Data directory not found: {data_path}")
+    start_time = time.perf_counter_ns()
 
     # Find all parquet files in data directory
-    parquet_files = list(data_path_obj.rglob("*.parquet"))
-    if not parquet_files:
+    file_paths = _find_parquet_files(columns_to_check, injection_patterns, data_path)
+    if not file_paths:
         return SQLInjectionReport(
             total_files_scanned=0,
             total_rows_scanned=0,
@@ -101,97 +621,199 @@ def sql_injection_report(
             scan_duration_ms=0.0,
         )
 
-    # Initialize DuckDB connection
-    conn = duckdb.connect()
-    violations: list[SQLInjectionResult] = []
-    total_rows_scanned = 0
-
-    try:
-        for file_path in parquet_files:
-            file_path_str = str(file_path)
-
-            # Get file info first
-            file_info_query = f"""
-            SELECT COUNT(*) as row_count
-            FROM read_parquet('{file_path_str}')
-            """
-            file_info = conn.execute(file_info_query).fetchone()
-            file_row_count = file_info[0] if file_info else 0
-            total_rows_scanned += file_row_count
-
-            # Check each column for each pattern
-            for column in columns_to_check:
-                for i, pattern in enumerate(injection_patterns):
-                    # Create a query to find violations
-                    # We need to escape the pattern for SQL and handle the regex properly
-                    escaped_pattern = pattern.replace(
-                        "'", "''"
-                    )  # Escape single quotes for SQL
-
-                    violation_query = f"""
-                    SELECT
-                        ROW_NUMBER() OVER (ORDER BY (SELECT NULL)) - 1 as row_index,
-                        "{column}" as column_value,
-                        *
-                    FROM read_parquet('{file_path_str}')
-                    WHERE "{column}" IS NOT NULL
-                    AND regexp_matches("{column}"::VARCHAR, '{escaped_pattern}')
-                    """
-
-                    try:
-                        cur = conn.execute(violation_query)
-                        results = cur.fetchall()
-                        col_names = [d[0] for d in cur.description]
-
-                        for row in results:
-                            # Map row to dict using column names
-                            row_dict = {
-                                name: row[idx] for idx, name in enumerate(col_names)
-                            }
-                            row_index = int(row_dict.get("row_index", 0))
-                            column_value = row_dict.get("column_value")
-                            # Remove helper fields from message payload
-                            row_dict.pop("row_index", None)
-                            row_dict.pop("column_value", None)
-                            # Serialize full message to JSON (best-effort via str())
-                            safe_row = {
-                                k: (
-                                    v.isoformat() if hasattr(v, "isoformat") else str(v)
-                                )
-                                for k, v in row_dict.items()
-                            }
-                            message_json = json.dumps(safe_row, ensure_ascii=False)
-                            violation = SQLInjectionResult(
-                                file_path=file_path_str,
-                                row_index=int(row_index),
-                                column_name=column,
-                                column_value=str(column_value),
-                                matched_pattern=pattern,
-                                message_json=message_json,
-                            )
-                            violations.append(violation)
-                    except Exception as e:
-                        # Log the error but continue with other patterns
-                        print(
-                            f"Warning: Error checking pattern {i+1} in column '{column}' of file '{file_path_str}': {e}"
-                        )
-                        continue
-
-    finally:
-        conn.close()
+    file_rows, violations = _scan_parquet_files(
+        file_paths, columns_to_check, injection_patterns, max_violations=max_violations
+    )
 
-    end_time = time.time()
-    scan_duration_ms = (end_time - start_time) * 1000
+    scan_duration_ms = elapsed_ms_since(start_time)
 
     return SQLInjectionReport(
-        total_files_scanned=len(parquet_files),
-        total_rows_scanned=total_rows_scanned,
+        total_files_scanned=len(file_paths),
+        total_rows_scanned=sum(file_rows.values()),
         violations_found=len(violations),
         violations=violations,
         scan_duration_ms=scan_duration_ms,
     )
 
 
+# File names of the incremental scan state, kept next to the saved report
+_REPORT_FILENAME = "sql_injection_report.parquet"
+_MANIFEST_FILENAME = ".scan_manifest.parquet"
+
+
+def _scan_key(columns_to_check: list[str], injection_patterns: list[str]) -> str:
+    """Identify a scan configuration; cached results are only reused for it."""
+    return json.dumps({"columns": columns_to_check, "patterns": injection_patterns})
+
+
+def _load_unchanged_violations(
+    file_paths: list[str], scan_key: str, output_dir: str
+) -> tuple[set[str], list[SQLInjectionResult]]:
+    """Find files unchanged since the last incremental scan and their results.
+
+    Cached results are only trusted when the manifest was written for the same
+    scan configuration and the saved report is the one it was written with.
+
+    Args:
+        file_paths: Parquet files currently under the data directory
+        scan_key: Identifier from _scan_key for the current scan
+        output_dir: Directory holding the saved report and manifest
+
+    Returns:
+        Tuple of (unchanged file paths, their previously found violations)
+    """
+    report_path = Path(output_dir) / _REPORT_FILENAME
+    manifest_path = Path(output_dir) / _MANIFEST_FILENAME
+    if not report_path.exists() or not manifest_path.exists():
+        return set(), []
+
+    manifest = pl.read_parquet(manifest_path)
+    if manifest.is_empty() or (
+        manifest["scan_key"][0] != scan_key
+        or manifest["report_mtime_ns"][0] != report_path.stat().st_mtime_ns
+    ):
+        return set(), []
+
+    previous = {
+        file_path: (mtime_ns, size)
+        for file_path, mtime_ns, size in manifest.select(
+            "file_path", "mtime_ns", "size"
+        ).iter_rows()
+    }
+    unchanged = set()
+    for file_path in file_paths:
+        stat = Path(file_path).stat()
+        if previous.get(file_path) == (stat.st_mtime_ns, stat.st_size):
+            unchanged.add(file_path)
+    if not unchanged:
+        return set(), []
+
+    cached = pl.read_parquet(report_path).filter(
+        pl.col("file_path").is_in(list(unchanged))
+    )
+    violations = [
+        SQLInjectionResult.model_construct(**row)
+        for row in cached.iter_rows(named=True)
+    ]
+    return unchanged, violations
+
+
+def _build_scan_manifest(
+    file_paths: list[str], stats: dict[str, os.stat_result], scan_key: str
+) -> pl.DataFrame:
+    """Build the manifest describing the files an incremental scan covered.
+
+    Args:
+        file_paths: Parquet files covered by the scan
+        stats: File stats taken before the scan
+        scan_key: Identifier from _scan_key for the scan
+
+    Returns:
+        Manifest DataFrame; report_mtime_ns is filled in once the report is saved
+    """
+    return pl.DataFrame(
+        {
+            "file_path": file_paths,
+            "mtime_ns": [stats[file_path].st_mtime_ns for file_path in file_paths],
+            "size": [stats[file_path].st_size for file_path in file_paths],
+            "scan_key": [scan_key] * len(file_paths),
+        },
+        schema={
+            "file_path": pl.String,
+            "mtime_ns": pl.Int64,
+            "size": pl.Int64,
+            "scan_key": pl.String,
+        },
+    )
+
+
+def _save_scan_manifest(manifest: pl.DataFrame, report_path: str) -> None:
+    """Save the incremental scan manifest next to the report it describes.
+
+    Args:
+        manifest: Manifest from _build_scan_manifest
+        report_path: Path of the freshly saved parquet report
+    """
+    report_mtime_ns = Path(report_path).stat().st_mtime_ns
+    manifest.with_columns(
+        pl.lit(report_mtime_ns, dtype=pl.Int64).alias("report_mtime_ns")
+    ).write_parquet(Path(report_path).parent / _MANIFEST_FILENAME)
+
+
+def _incremental_injection_report(
+    columns_to_check: list[str],
+    injection_patterns: list[str],
+    data_path: str,
+    output_dir: str,
+) -> tuple[SQLInjectionReport, pl.DataFrame]:
+    """Detect SQL injection patterns, rescanning only changed files.
+
+    Violations of files whose mtime and size match the manifest of the last
+    incremental run (same columns and patterns) are taken from the saved
+    report; only new or modified files are scanned.
+
+    Args:
+        columns_to_check: List of column names to check for SQL injection patterns
+        injection_patterns: List of regex patterns to detect SQL injection attempts
+        data_path: Path to the data directory containing parquet files
+        output_dir: Directory holding the previous report and manifest
+
+    Returns:
+        Tuple of (report, manifest to save with _save_scan_manifest once the
+        report has been written)
+
+    Raises:
+        FileNotFoundError: If data directory doesn't exist
+        ValueError: If columns_to_check or injection_patterns are empty
+    """
+    start_time = time.perf_counter_ns()
+
+    file_paths = _find_parquet_files(columns_to_check, injection_patterns, data_path)
+    scan_key = _scan_key(columns_to_check, injection_patterns)
+    # Stat before scanning so files modified mid-scan are rescanned next time
+    stats = {file_path: Path(file_path).stat() for file_path in file_paths}
+
+    unchanged, cached_violations = _load_unchanged_violations(
+        file_paths, scan_key, output_dir
+    )
+    changed = [file_path for file_path in file_paths if file_path not in unchanged]
+
+    file_rows: dict[str, int] = {}
+    new_violations: list[SQLInjectionResult] = []
+    if file_paths:
+        file_rows, new_violations = _scan_parquet_files(
+            changed, columns_to_check, injection_patterns, count_paths=file_paths
+        )
+
+    # Scans are ordered by file path; keep that order across both sources
+    violations = sorted(
+        cached_violations + new_violations, key=lambda violation: violation.file_path
+    )
+
+    report = SQLInjectionReport(
+        total_files_scanned=len(file_paths),
+        total_rows_scanned=sum(file_rows.values()),
+        violations_found=len(violations),
+        violations=violations,
+        scan_duration_ms=elapsed_ms_since(start_time),
+    )
+    return report, _build_scan_manifest(file_paths, stats, scan_key)
+
+
+# Rows per row group of the saved report, small enough for file_path pruning
+_REPORT_ROW_GROUP_SIZE = 8192
+
+# Column types of the saved violations report
+_VIOLATIONS_SCHEMA = {
+    "file_path": pl.String,
+    "row_index": pl.Int64,
+    "column_name": pl.String,
+    "column_value": pl.String,
+    "matched_pattern": pl.String,
+    "message_json": pl.String,
+}
+
+
 def _create_violations_dataframe(violations: list[SQLInjectionResult]) -> pl.DataFrame:
     """Create a Polars DataFrame from SQL injection violations.
 
@@ -201,33 +823,18 @@ def _create_violations_dataframe(violations: list[SQLInjectionResult]) -> pl.Dat
     Returns:
         Polars DataFrame with violation data
     """
-    if not violations:
-        return pl.DataFrame(
-            {
-                "file_path": [],
-                "row_index": [],
-                "column_name": [],
-                "column_value": [],
-                "matched_pattern": [],
-                "message_json": [],
-            }
-        )
-
-    # Convert violations to dictionary format for DataFrame creation
-    violation_data = []
-    for violation in violations:
-        violation_data.append(
-            {
-                "file_path": violation.file_path,
-                "row_index": violation.row_index,
-                "column_name": violation.column_name,
-                "column_value": violation.column_value,
-                "matched_pattern": violation.matched_pattern,
-                "message_json": violation.message_json or "",
-            }
-        )
-
-    return pl.DataFrame(violation_data)
+    # Build columns directly (no per-row dicts or schema inference)
+    return pl.DataFrame(
+        {
+            "file_path": [v.file_path for v in violations],
+            "row_index": [v.row_index for v in violations],
+            "column_name": [v.column_name for v in violations],
+            "column_value": [v.column_value for v in violations],
+            "matched_pattern": [v.matched_pattern for v in violations],
+            "message_json": [v.message_json or "" for v in violations],
+        },
+        schema=_VIOLATIONS_SCHEMA,
+    )
 
 
 def _save_injection_report_to_parquet(
@@ -250,7 +857,7 @@ def _save_injection_report_to_parquet(
     output_path.mkdir(parents=True, exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    parquet_path = output_path / "sql_injection_report.parquet"
+    parquet_path = output_path / _REPORT_FILENAME
 
     # Create violations DataFrame
     violations_df = _create_violations_dataframe(report.violations)
@@ -259,7 +866,17 @@ def _save_injection_report_to_parquet(
         if parquet_path.exists():
             parquet_path.unlink()
 
-        violations_df.write_parquet(str(parquet_path), compression="zstd")
+        # Sorted by file and row so readers filtering on file_path can skip
+        # row groups via their min/max statistics
+        violations_df = violations_df.sort(
+            ["file_path", "row_index"], maintain_order=True
+        )
+        violations_df.write_parquet(
+            str(parquet_path),
+            compression="zstd",
+            statistics=True,
+            row_group_size=_REPORT_ROW_GROUP_SIZE,
+        )
         print(
             f"📁 SQL injection report saved: {parquet_path} ({len(violations_df)} violations)"
         )
@@ -286,20 +903,31 @@ def print_injection_report(report: SQLInjectionReport) -> None:
     Args:
         report: SQLInjectionReport to print
     """
-    print("=" * 80)
-    print("SQL INJECTION DETECTION REPORT")
-    print("=" * 80)
-    print(f"Files scanned: {report.total_files_scanned}")
-    print(f"Rows scanned: {report.total_rows_scanned:,}")
-    print(f"Violations found: {report.violations_found}")
-    print(f"Scan duration: {report.scan_duration_ms:.2f} ms")
-    print()
+    # Build the whole report in memory and write it once, rather than one
+    # print() per line
+    buf = io.StringIO()
+    buf.write(
+        f"{'=' * 80}\n"
+        "SQL INJECTION DETECTION REPORT\n"
+        f"{'=' * 80}\n"
+        f"Files scanned: {report.total_files_scanned}\n"
+        f"Rows scanned: {report.total_rows_scanned:,}\n"
+        f"Violations found: {report.violations_found}\n"
+        f"Scan duration: {report.scan_duration_ms:.2f} ms\n"
+        "\n"
+    )
 
     if report.violations:
-        print("VIOLATIONS DETECTED:")
-        print("-" * 80)
+        buf.write(f"VIOLATIONS DETECTED:\n{'-' * 80}\n")
+        buf.writelines(
+            f"{v.file_path}\trow {v.row_index}\t{v.column_name}\t"
+            f"{v.column_value}\t{v.matched_pattern}\n"
+            for v in report.violations
+        )
     else:
-        print("✅ No SQL injection patterns detected!")
+        buf.write("✅ No SQL injection patterns detected!\n")
+
+    sys.stdout.write(buf.getvalue())
 
 
 def main():
@@ -325,6 +953,17 @@ def main():
             default=BRONZE_PATH,
             help="Path to directory with parquet files to scan",
         )
+        mode = parser.add_mutually_exclusive_group()
+        mode.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only rescan files changed since the last incremental run",
+        )
+        mode.add_argument(
+            "--fail-fast",
+            action="store_true",
+            help="Stop at the first violation (the report lists only that one)",
+        )
         parser.add_argument(
             "--output-dir",
             type=str,
@@ -348,11 +987,24 @@ def main():
 
         print("🔍 Running SQL injection detection...")
         print(f"📁 Scanning directory: {bronze_path}")
-        report = sql_injection_report(args.columns, args.patterns, str(bronze_path))
+        manifest = None
+        if args.incremental:
+            report, manifest = _incremental_injection_report(
+                args.columns, args.patterns, str(bronze_path), str(output_dir)
+            )
+        else:
+            report = sql_injection_report(
+                args.columns,
+                args.patterns,
+                str(bronze_path),
+                max_violations=1 if args.fail_fast else None,
+            )
         print_injection_report(report)
 
         # Save report to parquet file
         parquet_path = _save_injection_report_to_parquet(report, str(output_dir))
+        if manifest is not None and parquet_path.endswith(".parquet"):
+            _save_scan_manifest(manifest, parquet_path)
         if report.violations_found > 0:
             print(
                 f"⚠️  Found {report.violations_found} potential SQL injection patterns!"
@@ -3,6 +3,6 @@
 import time
 
 
-def elapsed_ms_since(start_time: float) -> float:
-    """Milliseconds elapsed since the given start_time (time.time())."""
-    return (time.time() - start_time) * 1000
+def elapsed_ms_since(start_ns: int) -> float:
+    """Milliseconds elapsed since the given start_ns (time.perf_counter_ns())."""
+    return (time.perf_counter_ns() - start_ns) / 1_000_000
@@ -1,12 +1,16 @@
 """Tests for Bronze layer ingestion pipeline."""
 
+import json
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 
+import polars as pl
 import pytest
 from upstream_home_test.io.api_client import APIClient, APIError
+from upstream_home_test.io.parquet_writer import GenericParquetWriter
 from upstream_home_test.pipelines.bronze_ingestion import run_bronze_ingestion
 from upstream_home_test.schemas.bronze import VehicleMessageRaw
-from upstream_home_test.utils.parquet import split_by_size
+from upstream_home_test.utils.parquet import estimate_parquet_size_mb, split_by_size
 
 
 class TestAPIClient:
@@ -127,6 +131,78 @@ class TestPartitioning:
         assert all(len(chunk) > 0 for chunk in chunks)
         assert sum(len(chunk) for chunk in chunks) == len(messages)
 
+    def test_estimate_parquet_size_matches_json_size(self):
+        """Test that the sampled estimate tracks the JSON-serialized size."""
+        messages = [
+            {
+                "vin": f"1HGBH41JXMN{i:06d}",
+                "manufacturer": "Honda",
+                "year": 2020,
+                "gearPosition": None,
+                "wipersState": i % 2 == 0,
+                "timestamp": datetime(2025, 1, 27, 10, i % 60, tzinfo=timezone.utc),
+                "speed": 65.5,
+            }
+            for i in range(2000)
+        ]
+        json_estimate_mb = len(json.dumps(messages, default=str)) * 0.3 / 1024**2
+
+        assert estimate_parquet_size_mb(messages) == pytest.approx(
+            json_estimate_mb, rel=0.05
+        )
+
+
+class TestParquetWriterSink:
+    """Test streaming LazyFrame writes."""
+
+    @staticmethod
+    def _frame() -> pl.LazyFrame:
+        timestamps = [
+            datetime(2025, 1, 27, 10, 15, tzinfo=timezone.utc),
+            datetime(2025, 1, 27, 10, 45, tzinfo=timezone.utc),
+            datetime(2025, 1, 27, 11, 5, tzinfo=timezone.utc),
+        ]
+        return pl.LazyFrame(
+            {"vin": ["A", "B", "C"], "timestamp": timestamps, "speed": [1.0, 2.0, 3.0]}
+        )
+
+    def test_sink_partitioned_layout(self, tmp_path):
+        """Partitioned sink writes one file per date/hour without the key columns."""
+        writer = GenericParquetWriter(
+            output_dir=str(tmp_path), partitioning_enabled=True
+        )
+
+        result = writer.sink(self._frame())
+
+        files = sorted(
+            p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*.parquet")
+        )
+        assert files == [
+            "date=2025-01-27/hour=10/data.parquet",
+            "date=2025-01-27/hour=11/data.parquet",
+        ]
+        for file in tmp_path.rglob("*.parquet"):
+            schema = pl.read_parquet_schema(file)
+            assert "date" not in schema
+            assert "hour" not in schema
+        first_hour = pl.read_parquet(tmp_path / "date=2025-01-27/hour=10/data.parquet")
+        assert first_hour.height == 2
+        assert result["rows"] == 3
+        assert result["files_written"] == 2
+
+    def test_sink_unpartitioned_single_file(self, tmp_path):
+        """Unpartitioned sink writes a single data.parquet in the output directory."""
+        writer = GenericParquetWriter(
+            output_dir=str(tmp_path), partitioning_enabled=False
+        )
+
+        result = writer.sink(self._frame())
+
+        assert [p.name for p in tmp_path.rglob("*.parquet")] == ["data.parquet"]
+        assert pl.read_parquet(tmp_path / "data.parquet").height == 3
+        assert result["rows"] == 3
+        assert result["files_written"] == 1
+
 
 class TestBronzeIngestion:
     """Test Bronze ingestion pipeline."""
@@ -1,9 +1,13 @@
 """Tests for Gold layer reports pipeline."""
 
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import polars as pl
 import pytest
 from upstream_home_test.pipelines.gold_reports import main, run_gold_reports
+from upstream_home_test.pipelines.reports.sql_report_runner import SQLReportRunner
+from upstream_home_test.schemas.silver import SILVER_DTYPES
 
 
 class TestGoldReports:
@@ -60,3 +64,98 @@ class TestGoldReports:
             main()
         assert exc.value.code == 1
         mock_run.assert_called_once()
+
+
+def _write_silver_partition(
+    silver_dir: Path, hour: int, data: dict[str, pl.Series]
+) -> None:
+    """Write one hive-partitioned Silver file, leaving other columns null."""
+    rows = len(next(iter(data.values())))
+    frame = pl.DataFrame(
+        [
+            data.get(name, pl.Series(name, [None] * rows, dtype))
+            for name, dtype in SILVER_DTYPES.items()
+        ]
+    )
+    partition = silver_dir / "date=2025-10-29" / f"hour={hour:02d}"
+    partition.mkdir(parents=True)
+    frame.write_parquet(partition / "data.parquet")
+
+
+class TestSQLReportRunner:
+    """Test the SQL report runner against real Silver files."""
+
+    def test_all_null_column_in_one_file(self, tmp_path: Path) -> None:
+        """Test that a Null-typed column in one file unifies with typed files."""
+        silver_dir = tmp_path / "silver"
+        _write_silver_partition(
+            silver_dir,
+            3,
+            {
+                "vin": pl.Series("vin", ["A"]),
+                "speed": pl.Series("speed", [None], pl.Null),
+            },
+        )
+        _write_silver_partition(
+            silver_dir,
+            4,
+            {"vin": pl.Series("vin", ["B"]), "speed": pl.Series("speed", [12.5])},
+        )
+        queries_dir = tmp_path / "queries"
+        queries_dir.mkdir()
+        (queries_dir / "speeds.sql").write_text(
+            "SELECT vin, speed FROM report_table ORDER BY vin"
+        )
+
+        runner = SQLReportRunner(queries_dir=str(queries_dir))
+        try:
+            result = runner.run_sql_report("speeds", str(silver_dir))
+        finally:
+            runner.close()
+
+        assert result["input_rows"] == 2
+        assert result["result_data"]["speed"].to_list() == [None, 12.5]
+
+    def test_run_multiple_reports_isolates_failures(self, tmp_path: Path) -> None:
+        """Test that a failing report does not stop the others."""
+        silver_dir = tmp_path / "silver"
+        _write_silver_partition(
+            silver_dir, 3, {"vin": pl.Series("vin", ["A", "B", "C"])}
+        )
+        queries_dir = tmp_path / "queries"
+        queries_dir.mkdir()
+        (queries_dir / "vin_count.sql").write_text(
+            "SELECT COUNT(*) AS vins FROM report_table"
+        )
+        (queries_dir / "broken.sql").write_text(
+            "SELECT no_such_column FROM report_table"
+        )
+
+        runner = SQLReportRunner(queries_dir=str(queries_dir))
+        try:
+            result = runner.run_multiple_reports(
+                ["vin_count", "broken"], str(silver_dir)
+            )
+        finally:
+            runner.close()
+
+        assert result["successful_reports"] == ["vin_count"]
+        assert result["failed_reports"] == ["broken"]
+        assert result["results"]["vin_count"]["input_rows"] == 3
+        assert result["results"]["vin_count"]["result_data"]["vins"].item() == 3
+        assert result["results"]["broken"]["status"] == "failed"
+
+    def test_run_multiple_reports_without_silver_data(self, tmp_path: Path) -> None:
+        """Test that an empty Silver directory raises FileNotFoundError."""
+        silver_dir = tmp_path / "silver"
+        silver_dir.mkdir()
+        queries_dir = tmp_path / "queries"
+        queries_dir.mkdir()
+        (queries_dir / "vin_count.sql").write_text("SELECT COUNT(*) FROM report_table")
+
+        runner = SQLReportRunner(queries_dir=str(queries_dir))
+        try:
+            with pytest.raises(FileNotFoundError):
+                runner.run_multiple_reports(["vin_count"], str(silver_dir))
+        finally:
+            runner.close()
@@ -1,13 +1,23 @@
 """Tests for Silver layer transformation pipeline."""
 
-from datetime import datetime
-from unittest.mock import patch
+import logging
+from datetime import date, datetime, timezone
+from unittest.mock import ANY, patch
 
 import polars as pl
 import pytest
 from pydantic import ValidationError
-from upstream_home_test.pipelines.silver_transform import run_silver_transform
-from upstream_home_test.schemas.silver import VehicleMessageCleaned, map_gear_position
+from upstream_home_test.pipelines.silver_transform import (
+    _apply_data_transformations,
+    _read_bronze_data,
+    _resolve_paths,
+    run_silver_transform,
+)
+from upstream_home_test.schemas.silver import (
+    VehicleMessageCleaned,
+    gear_position_expr,
+    map_gear_position,
+)
 
 
 class TestGearPositionMapping:
@@ -147,9 +157,13 @@ class TestSilverTransform:
     #     assert any("null VIN" in error for error in errors)
     #     assert any("invalid gear positions" in error for error in errors)
 
+    @patch(
+        "upstream_home_test.pipelines.silver_transform._list_bronze_files",
+        return_value=["bronze/data.parquet"],
+    )
     @patch("upstream_home_test.pipelines.silver_transform.pl.scan_parquet")
     @patch("upstream_home_test.pipelines.silver_transform.GenericParquetWriter")
-    def test_run_silver_transform_success(self, mock_write, mock_scan):
+    def test_run_silver_transform_success(self, mock_write, mock_scan, mock_list_files):
         """Test successful Silver transformation."""
         # Mock Bronze data
         mock_df = pl.DataFrame(
@@ -167,11 +181,11 @@ class TestSilverTransform:
                 ],
             }
         )
-        mock_scan.return_value.collect.return_value = mock_df
+        mock_scan.return_value = mock_df.lazy()
 
         # Mock write response
         mock_writer_instance = mock_write.return_value
-        mock_writer_instance.write.return_value = {
+        mock_writer_instance.sink.return_value = {
             "rows": 2,
             "output_path": "data/silver/vehicle_messages_cleaned.parquet",
             "duration_ms": 100.0,
@@ -184,27 +198,139 @@ class TestSilverTransform:
         assert result["filtered_rows"] == 1  # One null VIN filtered
         assert result["output_rows"] == 2
 
+        bronze_dir, _ = _resolve_paths()
+        mock_list_files.assert_called_once_with(bronze_dir, ANY)
         mock_scan.assert_called_once()
         mock_write.assert_called_once()
-        mock_writer_instance.write.assert_called_once()
-
+        mock_writer_instance.sink.assert_called_once()
+
+        written = mock_writer_instance.sink.call_args.args[0].collect()
+        assert written.schema["gear_position"] == pl.Int8
+        assert written.schema["manufacturer"] == pl.Categorical
+        assert written["gear_position"].to_list() == [3, 0]
+        assert written["manufacturer"].cast(pl.String).to_list() == ["Honda", "Toyota"]
+
+    @patch(
+        "upstream_home_test.pipelines.silver_transform._list_bronze_files",
+        return_value=["bronze/data.parquet"],
+    )
     @patch("upstream_home_test.pipelines.silver_transform.pl.scan_parquet")
-    def test_run_silver_transform_empty_bronze(self, mock_scan):
+    def test_run_silver_transform_empty_bronze(self, mock_scan, _mock_list_files):
         """Test Silver transformation with empty Bronze data."""
         # Mock empty Bronze data
-        mock_df = pl.DataFrame()
-        mock_scan.return_value.collect.return_value = mock_df
+        mock_df = pl.DataFrame(schema={"vin": pl.String})
+        mock_scan.return_value = mock_df.lazy()
 
         result = run_silver_transform()
 
         assert result["status"] == "completed"
         assert result["input_rows"] == 0
         assert result["output_rows"] == 0
+        mock_scan.assert_called_once()
+
+
+class TestReadBronzeData:
+    """Test scanning Bronze data."""
+
+    @staticmethod
+    def _write_bronze(path, vins):
+        path.mkdir(parents=True)
+        pl.DataFrame({"vin": vins}).write_parquet(path / "data.parquet")
+        return str(path / "data.parquet")
+
+    def test_since_prunes_earlier_partitions(self, tmp_path):
+        """Test that partitions dated before ``since`` are skipped."""
+        files = [
+            self._write_bronze(tmp_path / "date=2025-01-26" / "hour=10", ["A", "B"]),
+            self._write_bronze(tmp_path / "date=2025-01-27" / "hour=10", ["C", None]),
+        ]
+        logger = logging.getLogger("test_silver_transform")
+
+        lf, input_rows, filtered_rows = _read_bronze_data(
+            files, logger, since=date(2025, 1, 27)
+        )
+
+        assert input_rows == 2
+        assert filtered_rows == 1
+        assert lf.collect()["vin"].to_list() == ["C"]
+
+    def test_since_requires_date_partitions(self, tmp_path):
+        """Test that ``since`` on a non-hive Bronze directory is rejected."""
+        files = [self._write_bronze(tmp_path / "bronze", ["A"])]
+        logger = logging.getLogger("test_silver_transform")
+
+        with pytest.raises(ValueError, match="date=YYYY-MM-DD"):
+            _read_bronze_data(files, logger, since=date(2025, 1, 27))
 
 
 class TestDataTransformation:
     """Test data transformation logic."""
 
+    def test_all_null_columns_get_declared_types(self):
+        """Test that Null-typed Bronze columns are cast to Silver dtypes."""
+        bronze = pl.LazyFrame(
+            {
+                "vin": ["1HGBH41JXMN109186"],
+                "manufacturer": ["Honda "],
+                "gearPosition": ["D"],
+                "frontLeftDoorState": ["LOCKED"],
+                "wipersState": [True],
+                "driverSeatbeltState": ["LOCKED"],
+                "timestamp": [datetime(2025, 1, 27, 10, 30)],
+                "speed": pl.Series([None], dtype=pl.Null),
+                "rpm": pl.Series([None], dtype=pl.Null),
+            }
+        )
+
+        schema = _apply_data_transformations(bronze).collect_schema()
+
+        assert schema["speed"] == pl.Float64
+        assert schema["rpm"] == pl.Int64
+        assert pl.Null not in schema.dtypes()
+
+    @staticmethod
+    def _bronze_with_timestamps(timestamps: pl.Series) -> pl.LazyFrame:
+        """Build a minimal Bronze frame around the given timestamps."""
+        rows = len(timestamps)
+        return pl.LazyFrame(
+            {
+                "vin": ["1HGBH41JXMN109186"] * rows,
+                "manufacturer": ["Honda"] * rows,
+                "gearPosition": ["D"] * rows,
+                "frontLeftDoorState": ["LOCKED"] * rows,
+                "wipersState": [True] * rows,
+                "driverSeatbeltState": ["LOCKED"] * rows,
+                "timestamp": timestamps,
+            }
+        )
+
+    def test_non_utc_timestamps_converted_to_utc(self):
+        """Test that tz-aware non-UTC timestamps keep their instants in UTC."""
+        local = pl.Series(
+            "timestamp", [datetime(2025, 1, 27, 12, 30), datetime(2025, 7, 1, 9, 0)]
+        ).dt.replace_time_zone("Asia/Jerusalem")
+
+        result = _apply_data_transformations(
+            self._bronze_with_timestamps(local)
+        ).collect()
+
+        assert result.schema["timestamp"] == pl.Datetime("us", "UTC")
+        assert result["timestamp"].to_list() == [
+            datetime(2025, 1, 27, 10, 30, tzinfo=timezone.utc),
+            datetime(2025, 7, 1, 6, 0, tzinfo=timezone.utc),
+        ]
+
+    def test_utc_timestamps_unchanged(self):
+        """Test that timestamps already in UTC pass through unchanged."""
+        utc = pl.Series(
+            "timestamp", [datetime(2025, 1, 27, 10, 30, tzinfo=timezone.utc)]
+        )
+
+        result = _apply_data_transformations(self._bronze_with_timestamps(utc))
+
+        assert result.collect_schema()["timestamp"] == pl.Datetime("us", "UTC")
+        assert result.collect()["timestamp"].to_list() == utc.to_list()
+
     def test_manufacturer_cleaning(self):
         """Test manufacturer field cleaning."""
         df = pl.DataFrame({"manufacturer": ["Honda ", " Toyota", "Ford", "  BMW  "]})
@@ -233,16 +359,14 @@ class TestDataTransformation:
         """Test gear position mapping in DataFrame."""
         df = pl.DataFrame({"gear": ["P", "R", "N", "D", "L", "X", None]})
 
-        result = df.with_columns(
-            [
-                pl.col("gear")
-                .map_elements(map_gear_position, return_dtype=pl.Int64)
-                .alias("gear_position")
-            ]
-        )
+        result = df.with_columns(gear_position_expr("gear").alias("gear_position"))
 
         expected = [0, 1, 2, 3, 4, -1, None]
         assert result["gear_position"].to_list() == expected
+        assert result["gear_position"].dtype == pl.Int8
+        assert result["gear_position"].to_list() == [
+            map_gear_position(gear) for gear in df["gear"]
+        ]
 
     def test_vin_filtering(self):
         """Test VIN null filtering."""
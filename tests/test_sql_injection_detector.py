@@ -1,7 +1,8 @@
 """Unit tests for SQL injection detection functionality."""
 
-import tempfile
+import json
 from pathlib import Path
+from unittest.mock import patch
 
 import polars as pl
 import pytest
@@ -9,6 +10,10 @@ from pydantic import ValidationError
 from upstream_home_test.utils.sql_injection_detector import (
     SQLInjectionReport,
     SQLInjectionResult,
+    _incremental_injection_report,
+    _save_injection_report_to_parquet,
+    _save_scan_manifest,
+    _scan_files,
     print_injection_report,
     sql_injection_report,
 )
@@ -105,10 +110,9 @@ class TestSQLInjectionDetection:
     """Test SQL injection detection functionality."""
 
     @pytest.fixture()
-    def temp_data_dir(self) -> Path:
+    def temp_data_dir(self, tmp_path: Path) -> Path:
         """Create a temporary data directory with test data."""
-        temp_dir = Path(tempfile.mkdtemp())
-        data_dir = temp_dir / "data"
+        data_dir = tmp_path / "data"
         data_dir.mkdir(parents=True)
         return data_dir
 
@@ -307,6 +311,72 @@ class TestSQLInjectionDetection:
         file_paths = set(v.file_path for v in result.violations)
         assert len(file_paths) == 2
 
+    def test_message_json_keeps_each_files_own_columns(
+        self, temp_data_dir: Path
+    ) -> None:
+        """Test that files differing in unchecked columns keep their messages."""
+        self.create_test_parquet(
+            temp_data_dir, "a.parquet", [{"vin": "a;", "extra": "E"}]
+        )
+        self.create_test_parquet(
+            temp_data_dir, "b.parquet", [{"vin": "b;", "other": 5}]
+        )
+
+        result = sql_injection_report(
+            columns_to_check=["vin"],
+            injection_patterns=[r"(;)"],
+            data_path=str(temp_data_dir),
+        )
+
+        messages = {
+            Path(v.file_path).name: json.loads(v.message_json)
+            for v in result.violations
+        }
+        assert messages == {
+            "a.parquet": {"vin": "a;", "extra": "E"},
+            "b.parquet": {"vin": "b;", "other": "5"},
+        }
+
+    def test_corrupt_file_skips_only_itself(self, temp_data_dir: Path) -> None:
+        """Test that an unreadable parquet file does not abort the report."""
+        self.create_test_parquet(temp_data_dir, "good.parquet", [{"vin": "a;"}])
+        (temp_data_dir / "corrupt.parquet").write_bytes(b"not a parquet file")
+
+        result = sql_injection_report(
+            columns_to_check=["vin"],
+            injection_patterns=[r"(;)"],
+            data_path=str(temp_data_dir),
+        )
+
+        assert result.total_rows_scanned == 1
+        assert [Path(v.file_path).name for v in result.violations] == ["good.parquet"]
+
+    def test_all_null_columns_are_not_scanned(self, temp_data_dir: Path) -> None:
+        """Test that files whose checked columns are all NULL skip the scan."""
+        null_file = temp_data_dir / "nulls.parquet"
+        pl.DataFrame({"vin": [None, None]}, schema={"vin": pl.String}).write_parquet(
+            null_file
+        )
+        self.create_test_parquet(
+            temp_data_dir, "values.parquet", [{"vin": "1G4AP6949BX114240; --"}]
+        )
+
+        with patch(
+            "upstream_home_test.utils.sql_injection_detector._scan_files",
+            wraps=_scan_files,
+        ) as scan:
+            result = sql_injection_report(
+                columns_to_check=["vin"],
+                injection_patterns=[r"(;)"],
+                data_path=str(temp_data_dir),
+            )
+
+        scanned = [path for call in scan.call_args_list for path in call.args[1]]
+        assert str(null_file) not in scanned
+        assert result.total_files_scanned == 2
+        assert result.total_rows_scanned == 3
+        assert result.violations_found == 1
+
     def test_empty_directory(self, temp_data_dir: Path) -> None:
         """Test behavior with empty directory."""
         result = sql_injection_report(
@@ -390,15 +460,85 @@ class TestSQLInjectionDetection:
         assert isinstance(result, SQLInjectionReport)
         assert result.total_files_scanned == 1
 
+    def test_column_names_are_quoted(self, temp_data_dir: Path) -> None:
+        """Test that column names containing quotes are scanned safely."""
+        column = 'vin" IS NULL OR "vin'
+        test_data = [{column: "1G4AP6949BX114240"}, {column: "x'; DROP TABLE t"}]
+        self.create_test_parquet(temp_data_dir, "quoted.parquet", test_data)
+
+        result = sql_injection_report(
+            columns_to_check=[column],
+            injection_patterns=[r"(;)"],
+            data_path=str(temp_data_dir),
+        )
+
+        assert result.violations_found == 1
+        assert result.violations[0].column_name == column
+        assert result.violations[0].row_index == 1
+
+    def test_max_violations_limits_results(self, temp_data_dir: Path) -> None:
+        """Test that max_violations stops the scan after enough matches."""
+        test_data = [{"vin": f"1G4AP6949BX11424{i}; --"} for i in range(5)]
+        self.create_test_parquet(temp_data_dir, "many.parquet", test_data)
+
+        result = sql_injection_report(
+            columns_to_check=["vin"],
+            injection_patterns=[r"(;)"],
+            data_path=str(temp_data_dir),
+            max_violations=1,
+        )
+
+        assert result.violations_found == 1
+        assert result.total_rows_scanned == 5
+
+    def test_incremental_scan_reuses_unchanged_files(
+        self, temp_data_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test that incremental scans only rescan modified files."""
+        self.create_test_parquet(
+            temp_data_dir, "a.parquet", [{"vin": "1G4AP6949BX114241'; --"}]
+        )
+        changed = self.create_test_parquet(
+            temp_data_dir, "b.parquet", [{"vin": "1G4AP6949BX114242"}]
+        )
+        output_dir = str(tmp_path / "report")
+
+        def run() -> SQLInjectionReport:
+            report, manifest = _incremental_injection_report(
+                ["vin"], [r"(;)"], str(temp_data_dir), output_dir
+            )
+            report_path = _save_injection_report_to_parquet(report, output_dir)
+            _save_scan_manifest(manifest, report_path)
+            return report
+
+        assert run().violations_found == 1
+
+        # Second run reuses cached results instead of rescanning
+        with patch(
+            "upstream_home_test.utils.sql_injection_detector._scan_all_files"
+        ) as mock_scan:
+            report = run()
+        mock_scan.assert_not_called()
+        assert report.violations_found == 1
+        assert report.total_rows_scanned == 2
+
+        # Only the modified file is rescanned
+        pl.DataFrame({"vin": ["1G4AP6949BX114242; --"]}).write_parquet(changed)
+        report = run()
+        assert report.violations_found == 2
+        assert [v.file_path for v in report.violations] == [
+            str(temp_data_dir / "a.parquet"),
+            str(changed),
+        ]
+
 
 class TestCommonPatterns:
     """Test common SQL injection patterns functionality."""
 
     @pytest.fixture()
-    def temp_data_dir(self) -> Path:
+    def temp_data_dir(self, tmp_path: Path) -> Path:
         """Create a temporary data directory with test data."""
-        temp_dir = Path(tempfile.mkdtemp())
-        data_dir = temp_dir / "data"
+        data_dir = tmp_path / "data"
         data_dir.mkdir(parents=True)
         return data_dir
 